@@ -0,0 +1,110 @@
+from hashlib import sha256
+
+from django.db import transaction
+from django.db.models import Case, Count, Min, Value, When
+
+TEXT_FIELDS = ('street', 'neighbourhood', 'number', 'city', 'state', 'country')
+COORDINATE_FIELDS = ('latitude', 'longitude')
+FINGERPRINT_FIELDS = TEXT_FIELDS + COORDINATE_FIELDS
+
+
+def normalize(value):
+    return ' '.join(str(value).split()).casefold()
+
+
+def address_fingerprint(values):
+    """
+    Hash of the normalized address text, ignoring case and repeated
+    whitespace, and of the coordinates when there are any, used as the
+    unique lookup key for addresses. The same text with other coordinates
+    is another address, so no event can move the address of the others.
+    """
+    parts = [normalize(values[field]) for field in TEXT_FIELDS]
+    coordinates = [values.get(field) for field in COORDINATE_FIELDS]
+    if any(value is not None for value in coordinates):
+        parts += ['' if value is None else repr(float(value)) for value in coordinates]
+    return sha256('\x1f'.join(parts).encode()).hexdigest()
+
+
+def repoint_and_delete(address_model, event_model, replacements):
+    if not replacements:
+        return
+
+    event_model.objects\
+               .filter(address_id__in=replacements)\
+               .update(address_id=Case(*[When(address_id=address_id, then=Value(keep_id))
+                                         for address_id, keep_id in replacements.items()]))
+    address_model.objects.filter(id__in=replacements).delete()
+
+
+def merge_fingerprinted_duplicates(address_model, event_model, batch_size):
+    merged = 0
+    duplicated = address_model.objects\
+                              .filter(fingerprint__isnull=False)\
+                              .values('fingerprint')\
+                              .annotate(total=Count('id'), keep_id=Min('id'))\
+                              .filter(total__gt=1)\
+                              .order_by('fingerprint')
+
+    while True:
+        groups = list(duplicated[:batch_size])
+        if not groups:
+            return merged
+
+        keep_ids = {group['fingerprint']: group['keep_id'] for group in groups}
+        duplicates = address_model.objects\
+                                  .filter(fingerprint__in=keep_ids)\
+                                  .exclude(id__in=keep_ids.values())\
+                                  .values_list('id', 'fingerprint')
+
+        with transaction.atomic():
+            replacements = {address_id: keep_ids[fingerprint] for address_id, fingerprint in duplicates}
+            repoint_and_delete(address_model, event_model, replacements)
+        merged += len(replacements)
+
+
+def fingerprint_and_merge(address_model, event_model, batch_size):
+    filled = merged = 0
+
+    while True:
+        addresses = list(address_model.objects.filter(fingerprint__isnull=True).order_by('id')[:batch_size])
+        if not addresses:
+            return filled, merged
+
+        fingerprints = {address.id: address_fingerprint({field: getattr(address, field) for field in FINGERPRINT_FIELDS})
+                        for address in addresses}
+        keep_ids = dict(address_model.objects
+                                     .filter(fingerprint__in=fingerprints.values())
+                                     .values_list('fingerprint', 'id'))
+        replacements = {}
+        keepers = []
+
+        for address in addresses:
+            fingerprint = fingerprints[address.id]
+
+            if fingerprint in keep_ids:
+                replacements[address.id] = keep_ids[fingerprint]
+            else:
+                keep_ids[fingerprint] = address.id
+                address.fingerprint = fingerprint
+                keepers.append(address)
+
+        with transaction.atomic():
+            repoint_and_delete(address_model, event_model, replacements)
+            address_model.objects.bulk_update(keepers, ['fingerprint'])
+
+        filled += len(keepers)
+        merged += len(replacements)
+
+
+def merge_duplicate_addresses(address_model, event_model, batch_size=1000):
+    """
+    Fingerprints addresses saved without one and merges every duplicate into
+    the oldest address with the same fingerprint, repointing its events.
+    Works in transactions of ``batch_size`` addresses and returns the number
+    of addresses fingerprinted and merged.
+    """
+    merged = merge_fingerprinted_duplicates(address_model, event_model, batch_size)
+    filled, merged_unfingerprinted = fingerprint_and_merge(address_model, event_model, batch_size)
+
+    return filled, merged + merged_unfingerprinted
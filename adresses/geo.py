@@ -0,0 +1,88 @@
+import math
+
+from django.db.models import F, Q
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0
+GRID_CELL_DEGREES = 0.1
+GRID_ROWS = round(180 / GRID_CELL_DEGREES)
+GRID_COLUMNS = round(360 / GRID_CELL_DEGREES)
+
+
+def grid_row(latitude):
+    return min(GRID_ROWS - 1, max(0, math.floor((latitude + 90) / GRID_CELL_DEGREES)))
+
+
+def grid_column(longitude):
+    return math.floor((longitude + 180) / GRID_CELL_DEGREES) % GRID_COLUMNS
+
+
+def grid_cell(latitude, longitude):
+    """
+    Row-major id of the grid cell containing the point, so every row of
+    cells covered by a search is one contiguous range of ids.
+    """
+    if latitude is None or longitude is None:
+        return None
+    return grid_row(latitude) * GRID_COLUMNS + grid_column(longitude)
+
+
+def grid_cell_ranges(latitude, longitude, radius_km):
+    latitude_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    first_row = grid_row(latitude - latitude_delta)
+    last_row = grid_row(latitude + latitude_delta)
+
+    widest_latitude = min(90.0, abs(latitude) + latitude_delta)
+    cos_latitude = math.cos(math.radians(widest_latitude))
+    longitude_delta = 180.0 if cos_latitude < 1e-9 else math.degrees(radius_km / (EARTH_RADIUS_KM * cos_latitude))
+
+    if longitude_delta >= 180.0:
+        column_spans = [(0, GRID_COLUMNS - 1)]
+    else:
+        first_column = grid_column(longitude - longitude_delta)
+        last_column = grid_column(longitude + longitude_delta)
+
+        if first_column <= last_column:
+            column_spans = [(first_column, last_column)]
+        else:
+            column_spans = [(first_column, GRID_COLUMNS - 1), (0, last_column)]
+
+    return [(row * GRID_COLUMNS + first, row * GRID_COLUMNS + last)
+            for row in range(first_row, last_row + 1)
+            for first, last in column_spans]
+
+
+def distance_km(latitude, longitude, prefix=''):
+    """
+    Haversine distance in km from the point to the ``latitude`` and
+    ``longitude`` columns reached through ``prefix``.
+    """
+    delta_latitude = Radians(F(f'{prefix}latitude') - latitude)
+    delta_longitude = Radians(F(f'{prefix}longitude') - longitude)
+
+    haversine = (Power(Sin(delta_latitude / 2), 2) +
+                 math.cos(math.radians(latitude)) * Cos(Radians(F(f'{prefix}latitude'))) *
+                 Power(Sin(delta_longitude / 2), 2))
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(haversine))
+
+
+def filter_near(queryset, latitude, longitude, radius_km, prefix=''):
+    """
+    Keeps rows within ``radius_km`` of the point: first by the indexed grid
+    cell ranges, then by the exact haversine distance of the survivors,
+    annotated as ``distance``. ``prefix`` is the path to the address, like
+    ``'address__'``, or empty when filtering addresses themselves.
+    """
+    from adresses.models import AdressesModel
+
+    cells = Q()
+    for first, last in grid_cell_ranges(latitude, longitude, radius_km):
+        cells |= Q(grid_cell__range=(first, last))
+
+    if prefix:
+        queryset = queryset.filter(**{f'{prefix}in': AdressesModel.objects.filter(cells).values('id')})
+    else:
+        queryset = queryset.filter(cells)
+
+    return queryset.annotate(distance=distance_km(latitude, longitude, prefix))\
+                   .filter(distance__lte=radius_km)
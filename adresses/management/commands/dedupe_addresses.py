@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from events.models import EventModel
+
+from adresses.dedup import merge_duplicate_addresses
+from adresses.models import AdressesModel
+
+
+class Command(BaseCommand):
+    help = 'Fingerprints addresses and merges duplicates, repointing their events.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        filled, merged = merge_duplicate_addresses(AdressesModel, EventModel, options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Fingerprinted {filled} addresses, merged {merged} duplicates.'))
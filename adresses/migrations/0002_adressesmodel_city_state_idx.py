@@ -0,0 +1,23 @@
+# Generated by Django 3.2.9 on 2026-10-18 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adresses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='adressesmodel',
+            name='city',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='adressesmodel',
+            name='state',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
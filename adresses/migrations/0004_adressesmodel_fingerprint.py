@@ -0,0 +1,18 @@
+# Generated by Django 3.2.9 on 2026-10-18 08:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adresses', '0003_adressesmodel_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adressesmodel',
+            name='fingerprint',
+            field=models.CharField(db_index=True, editable=False, max_length=64, null=True),
+        ),
+    ]
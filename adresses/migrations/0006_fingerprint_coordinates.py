@@ -0,0 +1,42 @@
+from hashlib import sha256
+
+from django.db import migrations
+from django.db.models import Q
+
+# A copy of adresses.dedup.address_fingerprint as of this migration, so
+# later changes to the live fingerprint cannot change what it does.
+TEXT_FIELDS = ('street', 'neighbourhood', 'number', 'city', 'state', 'country')
+COORDINATE_FIELDS = ('latitude', 'longitude')
+FINGERPRINT_FIELDS = TEXT_FIELDS + COORDINATE_FIELDS
+
+
+def normalize(value):
+    return ' '.join(str(value).split()).casefold()
+
+
+def address_fingerprint(values):
+    parts = [normalize(values[field]) for field in TEXT_FIELDS]
+    coordinates = [values.get(field) for field in COORDINATE_FIELDS]
+    if any(value is not None for value in coordinates):
+        parts += ['' if value is None else repr(float(value)) for value in coordinates]
+    return sha256('\x1f'.join(parts).encode()).hexdigest()
+
+
+def fingerprint_coordinates(apps, schema_editor):
+    AdressesModel = apps.get_model('adresses', 'AdressesModel')
+
+    addresses = list(AdressesModel.objects.filter(Q(latitude__isnull=False) | Q(longitude__isnull=False)))
+    for address in addresses:
+        address.fingerprint = address_fingerprint({field: getattr(address, field) for field in FINGERPRINT_FIELDS})
+    AdressesModel.objects.bulk_update(addresses, ['fingerprint'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adresses', '0005_merge_duplicate_addresses'),
+    ]
+
+    operations = [
+        migrations.RunPython(fingerprint_coordinates, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,28 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
+from adresses.dedup import FINGERPRINT_FIELDS, address_fingerprint
+from adresses.geo import grid_cell
+
 
 class AdressesModel(models.Model):
     street = models.CharField(max_length=255, null=False)
     neighbourhood = models.CharField(max_length=255,null=False)
     number = models.IntegerField()
-    city = models.CharField(max_length=255,null=False)
-    state = models.CharField(max_length=255,null=False)
+    city = models.CharField(max_length=255,null=False, db_index=True)
+    state = models.CharField(max_length=255,null=False, db_index=True)
     country = models.CharField(max_length=255,null=False)
+    latitude = models.FloatField(null=True, blank=True, validators=[MinValueValidator(-90), MaxValueValidator(90)])
+    longitude = models.FloatField(null=True, blank=True, validators=[MinValueValidator(-180), MaxValueValidator(180)])
+    grid_cell = models.IntegerField(null=True, editable=False, db_index=True)
+    fingerprint = models.CharField(max_length=64, null=True, unique=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        self.grid_cell = grid_cell(self.latitude, self.longitude)
+        self.fingerprint = address_fingerprint({field: getattr(self, field) for field in FINGERPRINT_FIELDS})
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def get_or_create_from_data(cls, address_data):
+        return cls.objects.get_or_create(fingerprint=address_fingerprint(address_data), defaults=address_data)
 
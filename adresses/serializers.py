@@ -6,4 +6,4 @@ from adresses.models import AdressesModel
 class AdressesSerializer(serializers.ModelSerializer):
     class Meta:
         model = AdressesModel
-        fields = '__all__'
+        fields = ('id', 'street', 'neighbourhood', 'number', 'city', 'state', 'country', 'latitude', 'longitude')
@@ -0,0 +1,109 @@
+"""
+Concurrent request throughput under ASGI, sync views vs async views.
+
+Seeds a synthetic catalogue into a throwaway database (SQLite, or Postgres
+when DATABASE_URL is set) and drives the ASGI application in-process with
+``--concurrency`` requests in flight, once with the plain handler, where
+Django runs every sync view on one thread, and once with the project's
+handler, which serves the read endpoints from async views.
+``--db-latency`` adds a delay to every query to emulate a database reached
+over the network.
+
+    python -m benchmarks.asgi_throughput --requests 400 --concurrency 16 --db-latency 2
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.utils import seed, setup_django, test_database
+
+
+def add_db_latency(seconds):
+    from django.db import connections
+    from django.db.backends.signals import connection_created
+
+    def delay(execute, sql, params, many, context):
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        if delay not in connection.execute_wrappers:
+            connection.execute_wrappers.append(delay)
+
+    connection_created.connect(install, weak=False)
+    for connection in connections.all():
+        install(None, connection)
+
+
+async def call(application, path, query, token):
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+        'path': path, 'raw_path': path.encode(), 'query_string': query.encode(), 'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'authorization', f'Token {token}'.encode())],
+        'client': ('127.0.0.1', 50000), 'server': ('testserver', 80),
+    }
+    statuses = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            statuses.append(message['status'])
+
+    await application(scope, receive, send)
+    return statuses[0]
+
+
+async def drive(application, requests, concurrency, token):
+    routes = [('/api/events/', 'base_price__gte={}'), ('/api/feedbacks/', 'page={}&page_size=20'),
+              ('/api/accounts/artists/', 'page_size={}')]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index):
+        path, query = routes[index % len(routes)]
+        async with semaphore:
+            return await call(application, path, query.format(index // len(routes) % 50 + 1), token)
+
+    start = time.perf_counter()
+    statuses = await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    assert set(statuses) == {200}, set(statuses)
+    return requests / elapsed
+
+
+def run(events, requests, concurrency, db_latency):
+    from django.core.cache import cache
+    from django.core.handlers.asgi import ASGIHandler
+    from easy_event.asgi import AsyncRoutesHandler
+
+    print(f'Seeding {events} events...')
+    dataset = seed(events=events, feedbacks=events)
+    token = dataset['tokens'][dataset['artist_ids'][0]]
+
+    if db_latency:
+        add_db_latency(db_latency / 1000)
+
+    print(f"{'handler':<10}{'concurrency':>12}{'req/s':>10}")
+    for name, application in (('sync', ASGIHandler()), ('async', AsyncRoutesHandler())):
+        cache.clear()
+        throughput = asyncio.run(drive(application, requests, concurrency, token))
+        print(f'{name:<10}{concurrency:>12}{throughput:>10.1f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--db-latency', type=float, default=0, help='milliseconds added to every query')
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        run(args.events, args.requests, args.concurrency, args.db_latency)
+
+
+if __name__ == '__main__':
+    main()
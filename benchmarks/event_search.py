@@ -0,0 +1,62 @@
+"""
+Event search latency benchmark.
+
+Seeds a synthetic catalogue into a throwaway database and times
+GET /api/events/ for each search filter as an artist would call it.
+
+    python -m benchmarks.event_search --events 1000000
+"""
+import argparse
+
+from benchmarks.utils import measure, seed, setup_django, summarize, test_database
+
+
+def run(events, repeat):
+    from django.core.cache import cache
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+
+    print(f'Seeding {events} events...')
+    dataset = seed(events=events, addresses=max(500, events // 100))
+
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {dataset['tokens'][dataset['artist_ids'][0]]}")
+    now = timezone.now()
+
+    scenarios = {
+        'no filters': {},
+        'music style': {'music_styles__name': 'Jazz'},
+        'city': {'address__city': 'City 7'},
+        'state': {'address__state': 'CA'},
+        'price range': {'base_price__gte': 100, 'base_price__lte': 110},
+        'next 7 days': {'datetime__lte': (now + timezone.timedelta(days=7)).isoformat()},
+        'full text': {'q': 'music 4242'},
+        'near 20 km': {'near': '-23.55,-46.63', 'radius': 20},
+        'combined': {'music_styles__name': 'Rock,Blues', 'address__state': 'NY', 'base_price__lte': 150,
+                     'datetime__lte': (now + timezone.timedelta(days=60)).isoformat()},
+    }
+
+    print(f"{'scenario':<14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, params in scenarios.items():
+        def search():
+            cache.clear()
+            response = client.get('/api/events/', params)
+            assert response.status_code == 200, response.content
+
+        result = summarize(measure(search, repeat))
+        print(f"{name:<14}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        run(args.events, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
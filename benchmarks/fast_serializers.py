@@ -0,0 +1,70 @@
+"""
+Serializer throughput benchmark.
+
+Seeds a synthetic catalogue into a throwaway database and compares rows per
+second of the DRF serializers against their compiled values() readers for
+the event list, the feedback list and the owner directory. Both sides
+include the database queries and are checked to render the same JSON.
+
+    python -m benchmarks.fast_serializers --rows 5000
+"""
+import argparse
+
+from benchmarks.utils import measure, seed, setup_django, summarize, test_database
+
+
+def run(rows, repeat):
+    from django.test import override_settings
+    from easy_event.fast_serializers import get_read_serializer
+    from events.models import EventModel
+    from events.serializers import EventSerializer
+    from feedbacks.models import FeedbackModel
+    from feedbacks.serializers import FeedbackSerializer
+    from rest_framework.renderers import JSONRenderer
+    from users.models import User
+    from users.serializers import UserSerializer
+
+    print(f'Seeding {rows} events...')
+    seed(events=rows, owners=rows, feedbacks=rows)
+
+    scenarios = {
+        'events': (EventSerializer, {},
+                   EventModel.objects.select_related('address').prefetch_related('music_styles').order_by('id')),
+        'feedbacks': (FeedbackSerializer, {'fields': ['id', 'description', 'stars', 'event', 'from_user', 'addressed_user']},
+                      FeedbackModel.objects.select_related('from_user', 'addressed_user', 'event__owner').order_by('id')),
+        'owners': (UserSerializer, {'fields': ['id', 'username', 'email', 'is_superuser']},
+                   User.objects.filter(is_superuser=True).order_by('id')),
+    }
+
+    print(f"{'scenario':<11}{'rows':>8}{'drf rows/s':>14}{'fast rows/s':>14}{'speedup':>10}")
+    for name, (serializer_class, kwargs, queryset) in scenarios.items():
+        count = queryset[:rows].count()
+        throughput, rendered = [], []
+
+        for fast in (False, True):
+            with override_settings(FAST_READ_SERIALIZERS=fast):
+                reader = get_read_serializer(serializer_class, **kwargs)
+
+            def serialize():
+                return reader.serialize(reader.values(queryset[:rows]))
+
+            rendered.append(JSONRenderer().render(serialize()))
+            throughput.append(count / (summarize(measure(serialize, repeat))['p50_ms'] / 1000))
+
+        assert rendered[0] == rendered[1], f'{name}: compiled output differs'
+        print(f'{name:<11}{count:>8}{throughput[0]:>14.0f}{throughput[1]:>14.0f}{throughput[1] / throughput[0]:>9.1f}x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        run(args.rows, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
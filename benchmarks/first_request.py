@@ -0,0 +1,163 @@
+"""
+First-request latency of a fresh worker, with and without warm-up.
+
+Seeds a small catalogue into a temporary SQLite file, then starts ``--runs``
+fresh interpreters per mode. Each imports the WSGI application as a gunicorn
+worker does. In the warm mode it then runs ``easy_event.warmup.warm_up``,
+the gunicorn ``post_worker_init`` hook. Each times the first and the second
+request to every route, in order, and the medians are reported.
+
+    python -m benchmarks.first_request --runs 5
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from wsgiref.util import setup_testing_defaults
+
+import django
+
+PASSWORD = 'first-request'
+
+
+def use_database(database):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'easy_event.settings')
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = database
+
+
+def prepare(database, events):
+    use_database(database)
+    django.setup()
+
+    from benchmarks.utils import seed
+    from django.core.management import call_command
+    from events.models import EventModel
+    from users.models import User
+
+    call_command('migrate', verbosity=0)
+    dataset = seed(events=events, artists=100, owners=10, addresses=200, feedbacks=events)
+    User.objects.create_user(username='first', email='first@example.com', password=PASSWORD, is_superuser=True)
+
+    return {
+        'token': dataset['tokens'][dataset['artist_ids'][0]],
+        'event': EventModel.objects.values_list('id', flat=True).first(),
+    }
+
+
+def routes(context):
+    login = json.dumps({'username': 'first', 'password': PASSWORD}).encode()
+
+    return [
+        ('events list', 'GET', '/api/events/', b'', context['token']),
+        ('events retrieve', 'GET', f'/api/events/{context["event"]}/', b'', context['token']),
+        ('feedbacks', 'GET', '/api/feedbacks/', b'', None),
+        ('artists', 'GET', '/api/accounts/artists/', b'', None),
+        ('owners', 'GET', '/api/accounts/owners/', b'', None),
+        ('login', 'POST', '/api/login/', login, None),
+    ]
+
+
+def call(application, method, path, body, token):
+    environ = {
+        'REQUEST_METHOD': method, 'PATH_INFO': path, 'HTTP_HOST': 'localhost', 'wsgi.input': io.BytesIO(body),
+        'CONTENT_LENGTH': str(len(body)), 'CONTENT_TYPE': 'application/json',
+    }
+    if token:
+        environ['HTTP_AUTHORIZATION'] = f'Token {token}'
+    setup_testing_defaults(environ)
+    statuses = []
+
+    result = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    try:
+        b''.join(result)
+    finally:
+        result.close()
+    return int(statuses[0].split()[0])
+
+
+def worker(database, context, warm):
+    """
+    Runs in a fresh interpreter; prints the timings as JSON.
+    """
+    use_database(database)
+    start = time.perf_counter()
+    from easy_event.wsgi import application
+    timings = {'boot_ms': (time.perf_counter() - start) * 1000, 'warm_up_ms': 0.0, 'routes': {}}
+
+    if warm:
+        from easy_event.warmup import warm_up
+        timings['warm_up_ms'] = warm_up()['seconds'] * 1000
+
+    for name, method, path, body, token in routes(context):
+        durations = []
+        for _ in range(2):
+            start = time.perf_counter()
+            status = call(application, method, path, body, token)
+            durations.append((time.perf_counter() - start) * 1000)
+            assert status < 300, (name, status)
+        timings['routes'][name] = durations
+
+    print(json.dumps(timings))
+
+
+def spawn(database, context, warm):
+    command = [sys.executable, '-m', 'benchmarks.first_request', '--worker', database, '--context', json.dumps(context)]
+    if warm:
+        command.append('--warm')
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def run(events, runs):
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'first_request.sqlite3')
+        context = json.loads(subprocess.run(
+            [sys.executable, '-m', 'benchmarks.first_request', '--prepare', database, '--events', str(events)],
+            capture_output=True, text=True, check=True).stdout.splitlines()[-1])
+
+        results = {warm: [spawn(database, context, warm) for _ in range(runs)] for warm in (False, True)}
+
+    def median(warm, pick):
+        return statistics.median(pick(result) for result in results[warm])
+
+    print(f'{events} events, median of {runs} fresh processes per mode')
+    print(f'{"":<18} {"cold first":>11} {"warm first":>11} {"second":>8}')
+    for name, *_ in routes(context):
+        cold = median(False, lambda result: result['routes'][name][0])
+        warm = median(True, lambda result: result['routes'][name][0])
+        second = median(True, lambda result: result['routes'][name][1])
+        print(f'{name:<18} {cold:>8.2f} ms {warm:>8.2f} ms {second:>5.2f} ms')
+
+    print(f'{"all first requests":<18} {median(False, lambda r: sum(d[0] for d in r["routes"].values())):>8.2f} ms '
+          f'{median(True, lambda r: sum(d[0] for d in r["routes"].values())):>8.2f} ms')
+    print(f'boot {median(False, lambda r: r["boot_ms"]):.0f} ms, '
+          f'warm-up {median(True, lambda r: r["warm_up_ms"]):.0f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1000)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--prepare', help=argparse.SUPPRESS)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--context', help=argparse.SUPPRESS)
+    parser.add_argument('--warm', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.prepare:
+        print(json.dumps(prepare(args.prepare, args.events)))
+    elif args.worker:
+        worker(args.worker, json.loads(args.context), args.warm)
+    else:
+        run(args.events, args.runs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+"""
+Load test for every API route.
+
+Seeds a configurable synthetic dataset into a throwaway database, drives
+each route under easy_event/urls.py with concurrent clients and reports
+p50/p95/p99 latency, requests per second and SQL queries per request. Read
+routes run with --concurrency clients. Write routes run with
+--write-concurrency clients, 1 by default because SQLite serializes writers.
+Results are saved as JSON, and two saved runs can be compared.
+
+    python -m benchmarks.load_test --events 10000 --requests 200 --concurrency 8
+    python -m benchmarks.load_test --compare load_test_abc1234.json load_test_def5678.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.utils import seed, setup_django, summarize, test_database
+
+PASSWORD = 'load-test'
+EVENT_SEARCHES = [{}, {'music_styles__name': 'Jazz'}, {'address__state': 'NY'}, {'base_price__lte': 50},
+                  {'q': 'live music'}, {'near': '-23.55,-46.63', 'radius': 50}]
+ARTIST_ORDERINGS = ['username', '-hour_price', '-rating']
+
+
+class Route:
+    def __init__(self, name, method, build, write=False, settings=None):
+        self.name = name
+        self.method = method
+        self.build = build
+        self.write = write
+        self.settings = settings or {}
+
+
+def event_payload(index, details='Load test event'):
+    return {
+        'datetime': (datetime.now(timezone.utc) + timedelta(days=30, minutes=index)).isoformat(),
+        'repeat_event': 'None',
+        'details': f'{details} {index}',
+        'base_price': 50 + index % 100,
+        'address': {'street': f'Load Street {index % 50}', 'neighbourhood': 'Center', 'number': index % 50,
+                    'city': 'Load City', 'state': 'NY', 'country': 'Country'},
+        'music_styles': [{'name': 'Rock'}, {'name': 'Jazz'}],
+    }
+
+
+def fresh_events(owner_id, amount, label):
+    """
+    Events no other route touches, one per write request that consumes one.
+    """
+    from adresses.models import AdressesModel
+    from events.models import EventModel
+    from events.occurrences import refresh_next_occurrences
+
+    address_id = AdressesModel.objects.values_list('id', flat=True).first()
+    start = datetime.now(timezone.utc) + timedelta(days=60)
+    EventModel.objects.bulk_create([
+        EventModel(datetime=start + timedelta(days=index % 300), address_id=address_id, owner_id=owner_id,
+                   details=f'{label} {index}', base_price=10)
+        for index in range(amount)
+    ])
+    refresh_next_occurrences(datetime.now(timezone.utc))
+    return list(EventModel.objects.filter(details__startswith=f'{label} ').order_by('id').values_list('id', 'datetime'))
+
+
+def disposable_users(amount):
+    from rest_framework.authtoken.models import Token
+    from users.models import RatingSummaryModel, User
+
+    User.objects.bulk_create([
+        User(username=f'disposable{index}', email=f'disposable{index}@example.com', password='!', is_superuser=False,
+             phone='0', solo=True, hour_price=100)
+        for index in range(amount)
+    ])
+    user_ids = list(User.objects.filter(username__startswith='disposable').order_by('id').values_list('id', flat=True))
+    RatingSummaryModel.objects.bulk_create([RatingSummaryModel(user_id=user_id) for user_id in user_ids])
+    Token.objects.bulk_create([Token(key=f'{user_id:040d}', user_id=user_id) for user_id in user_ids])
+    return user_ids
+
+
+def prepare(dataset, requests):
+    from events.models import EventModel
+    from feedbacks.models import FeedbackModel
+    from feedbacks.pagination import FeedbackPagination
+    from users.models import User
+
+    owner_id, artist_ids = dataset['owner_ids'][0], dataset['artist_ids']
+    owner = User.objects.get(id=owner_id)
+    owner.set_password(PASSWORD)
+    # Staff may read /api/metrics.
+    owner.is_staff = True
+    owner.save()
+
+    owner_events = list(EventModel.objects.filter(owner_id=owner_id, datetime__gte=datetime.now(timezone.utc))
+                                          .values_list('id', flat=True)[:requests])
+    lineup_events = fresh_events(owner_id, requests, 'Lineup event')
+    EventModel.candidatures.through.objects.bulk_create([
+        EventModel.candidatures.through(eventmodel_id=event_id, user_id=artist_ids[index % len(artist_ids)])
+        for index, (event_id, _) in enumerate(lineup_events)
+    ])
+
+    return {
+        'owner': owner_id,
+        'owner_username': owner.username,
+        'owner_events': owner_events or [event_id for event_id, _ in fresh_events(owner_id, requests, 'Owner event')],
+        'artists': artist_ids,
+        'tokens': dataset['tokens'],
+        'feedback_pages': max(1, -(-FeedbackModel.objects.count() // FeedbackPagination.page_size)),
+        'lineup_events': lineup_events,
+        'feedback_events': [event_id for event_id, _ in fresh_events(owner_id, requests, 'Feedback event')],
+        'delete_events': [event_id for event_id, _ in fresh_events(owner_id, requests, 'Disposable event')],
+        'disposable_users': disposable_users(requests),
+    }
+
+
+def routes():
+    def artist(context, index):
+        return context['tokens'][context['artists'][index % len(context['artists'])]]
+
+    def owner(context):
+        return context['tokens'][context['owner']]
+
+    def owner_event(context, index):
+        return context['owner_events'][index % len(context['owner_events'])]
+
+    return [
+        Route('events list (artist)', 'get', lambda c, i: (
+            '/api/events/', {**EVENT_SEARCHES[i % len(EVENT_SEARCHES)], 'page_size': 20 + i % 5}, artist(c, i))),
+        Route('events list (owner)', 'get', lambda c, i: ('/api/events/', {'page_size': 20}, owner(c))),
+        Route('events retrieve', 'get', lambda c, i: (f'/api/events/{owner_event(c, i)}/', {}, artist(c, i))),
+        Route('events occurrences', 'get', lambda c, i: ('/api/events/occurrences/', {'limit': 50 + i % 5}, artist(c, i))),
+        Route('event feedbacks', 'get', lambda c, i: (f'/api/events/{owner_event(c, i)}/feedbacks/', {}, None)),
+        Route('feedbacks', 'get', lambda c, i: ('/api/feedbacks/', {'page': i % min(5, c['feedback_pages']) + 1}, None)),
+        Route('artists', 'get', lambda c, i: (
+            '/api/accounts/artists/', {'ordering': ARTIST_ORDERINGS[i % len(ARTIST_ORDERINGS)]}, None)),
+        Route('owners', 'get', lambda c, i: ('/api/accounts/owners/', {}, None)),
+        Route('metrics', 'get', lambda c, i: ('/api/metrics', {}, owner(c)), settings={'METRICS_ENABLED': True}),
+        Route('account retrieve', 'get', lambda c, i: (
+            f"/api/accounts/{c['artists'][i % len(c['artists'])]}/", {}, artist(c, i))),
+
+        Route('login', 'post', lambda c, i: (
+            '/api/login/', {'username': c['owner_username'], 'password': PASSWORD}, None), write=True),
+        Route('account create', 'post', lambda c, i: ('/api/accounts/', {
+            'username': f'new{i}', 'password': PASSWORD, 'email': f'new{i}@example.com', 'is_superuser': False,
+            'phone': '0', 'solo': True, 'hour_price': 100}, None), write=True),
+        Route('account update', 'put', lambda c, i: (
+            f"/api/accounts/{c['artists'][i % len(c['artists'])]}/", {'phone': f'{i:011d}'}, artist(c, i)), write=True),
+        Route('account delete', 'delete', lambda c, i: (
+            f"/api/accounts/{c['disposable_users'][i]}/", {}, f"{c['disposable_users'][i]:040d}"), write=True),
+        Route('events create', 'post', lambda c, i: ('/api/events/', event_payload(i), owner(c)), write=True),
+        Route('events update', 'put', lambda c, i: (
+            f'/api/events/{owner_event(c, i)}/', event_payload(i, 'Updated event'), owner(c)), write=True),
+        Route('candidature apply', 'patch', lambda c, i: (
+            f'/api/events/{owner_event(c, i)}/candidatures/', {}, artist(c, i)), write=True),
+        Route('candidature remove', 'patch', lambda c, i: (
+            f'/api/events/{owner_event(c, i)}/candidatures/', {'remove_artists': [c['artists'][i % len(c['artists'])]]},
+            owner(c)), write=True),
+        Route('lineup', 'patch', lambda c, i: (f"/api/events/{c['lineup_events'][i][0]}/lineup/", {'lineup': [{
+            'artist_id': c['artists'][i % len(c['artists'])],
+            'performance_datetime': c['lineup_events'][i][1].strftime('%Y-%m-%d %H:%M:%S')}]}, owner(c)), write=True),
+        Route('feedback create', 'post', lambda c, i: (f"/api/events/{c['feedback_events'][i]}/feedbacks/", {
+            'description': 'Load test', 'stars': i % 5 + 1, 'addressed_user': c['artists'][i % len(c['artists'])]},
+            owner(c)), write=True),
+        Route('events delete', 'delete', lambda c, i: (f"/api/events/{c['delete_events'][i]}/", {}, owner(c)), write=True),
+    ]
+
+
+def check_coverage(route_list, context):
+    from django.urls import URLPattern, get_resolver, resolve
+
+    def walk(patterns, prefix=''):
+        for pattern in patterns:
+            # resolve() drops the ^ of included regex patterns, as the router's are.
+            route = prefix + str(pattern.pattern).lstrip('^')
+            if isinstance(pattern, URLPattern):
+                yield route
+            elif not route.startswith('admin/'):
+                yield from walk(pattern.url_patterns, route)
+
+    covered = {resolve(route.build(context, 0)[0]).route for route in route_list}
+    return sorted(set(walk(get_resolver().url_patterns)) - covered)
+
+
+def drive(route, context, requests, concurrency):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    local = threading.local()
+
+    def one(index):
+        if not hasattr(local, 'client'):
+            local.client = APIClient(raise_request_exception=False)
+
+        path, data, token = route.build(context, index)
+        local.client.credentials(**({'HTTP_AUTHORIZATION': f'Token {token}'} if token else {}))
+        request = getattr(local.client, route.method)
+        options = {} if route.method == 'get' else {'format': 'json'}
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = request(path, data, **options)
+            duration = time.perf_counter() - start
+        return duration, len(queries), response.status_code
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(one, range(requests)))
+        elapsed = time.perf_counter() - start
+
+    durations, queries, statuses = zip(*results)
+    return {
+        'method': route.method.upper(),
+        'path': route.build(context, 0)[0],
+        'requests': requests,
+        'concurrency': concurrency,
+        'errors': sum(status >= 400 for status in statuses),
+        'statuses': {str(status): count for status, count in sorted(Counter(statuses).items())},
+        'requests_per_second': requests / elapsed,
+        'queries_per_request': sum(queries) / requests,
+        'max_queries': max(queries),
+        **summarize(durations),
+    }
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_results(results):
+    print(f"{'route':<22}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'errors':>8}")
+    for name, result in results.items():
+        print(f"{name:<22}{result['requests_per_second']:>9.1f}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+              f"{result['p99_ms']:>9.2f}{result['queries_per_request']:>9.1f}{result['errors']:>8}")
+
+
+def compare(old_path, new_path):
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = json.load(old_file), json.load(new_file)
+
+    print(f"{old['meta']['commit']} -> {new['meta']['commit']}")
+    print(f"{'route':<22}{'p50 ms':>18}{'p95 ms':>18}{'req/s':>18}{'queries':>14}")
+    for name, result in new['routes'].items():
+        before = old['routes'].get(name)
+        if before is None:
+            print(f'{name:<22}{"(new route)":>18}')
+            continue
+        columns = [f"{before[key]:.1f} -> {result[key]:.1f}"
+                   for key in ('p50_ms', 'p95_ms', 'requests_per_second', 'queries_per_request')]
+        print(f'{name:<22}{columns[0]:>18}{columns[1]:>18}{columns[2]:>18}{columns[3]:>14}')
+
+
+def run(args):
+    from django.db import connection
+    from django.test import override_settings
+
+    print(f'Seeding {args.events} events...')
+    dataset = seed(events=args.events, artists=args.artists, owners=args.owners, addresses=args.addresses,
+                   feedbacks=args.feedbacks, seed_value=args.seed)
+    context = prepare(dataset, args.requests)
+
+    route_list = [route for route in routes() if not args.routes or route.name in args.routes]
+    uncovered = check_coverage(routes(), context)
+    if uncovered:
+        print(f"Routes without a load scenario: {', '.join(uncovered)}")
+
+    results = {}
+    for route in route_list:
+        concurrency = args.write_concurrency if route.write else args.concurrency
+        with override_settings(**route.settings):
+            results[route.name] = drive(route, context, args.requests, concurrency)
+    print_results(results)
+
+    report = {
+        'meta': {
+            'commit': current_commit(),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'dataset': {key: getattr(args, key) for key in ('events', 'artists', 'owners', 'addresses', 'feedbacks', 'seed')},
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'write_concurrency': args.write_concurrency,
+        },
+        'routes': results,
+    }
+    output = args.output or f"load_test_{report['meta']['commit']}.json"
+    with open(output, 'w') as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f'Saved {output}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--artists', type=int, default=200)
+    parser.add_argument('--owners', type=int, default=20)
+    parser.add_argument('--addresses', type=int, default=500)
+    parser.add_argument('--feedbacks', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--requests', type=int, default=200, help='requests per route')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--write-concurrency', type=int, default=1)
+    parser.add_argument('--routes', type=lambda value: value.split(','), help='comma-separated route names')
+    parser.add_argument('--output', help='defaults to load_test_<commit>.json')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two saved runs and exit')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    setup_django()
+    with test_database():
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
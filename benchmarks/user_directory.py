@@ -0,0 +1,54 @@
+"""
+Artist and owner directory latency benchmark.
+
+Seeds synthetic accounts into a throwaway database and times one page of
+GET /api/accounts/artists/ and /api/accounts/owners/ per filter and ordering.
+
+    python -m benchmarks.user_directory --artists 100000
+"""
+import argparse
+
+from benchmarks.utils import measure, seed, setup_django, summarize, test_database
+
+
+def run(artists, repeat):
+    from rest_framework.test import APIClient
+
+    print(f'Seeding {artists} artists...')
+    seed(events=0, artists=artists, owners=max(10, artists // 100))
+
+    client = APIClient()
+
+    scenarios = {
+        'artists': ('/api/accounts/artists/', {}),
+        'by username': ('/api/accounts/artists/', {'ordering': 'username'}),
+        'by price desc': ('/api/accounts/artists/', {'ordering': '-hour_price'}),
+        'by rating': ('/api/accounts/artists/', {'ordering': '-rating'}),
+        'solo in range': ('/api/accounts/artists/', {'solo': 'true', 'hour_price__gte': 100,
+                                                     'hour_price__lte': 150, 'ordering': 'hour_price'}),
+        'owners': ('/api/accounts/owners/', {'ordering': 'username'}),
+    }
+
+    print(f"{'scenario':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, (url, params) in scenarios.items():
+        def directory():
+            response = client.get(url, params)
+            assert response.status_code == 200, response.content
+
+        result = summarize(measure(directory, repeat))
+        print(f"{name:<16}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--artists', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        run(args.artists, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+import os
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+import django
+
+MUSIC_STYLES = ['Rock', 'Country', 'Jazz', 'Blues', 'Samba', 'Pop', 'Funk', 'Metal', 'Reggae', 'Forro',
+                'Pagode', 'Sertanejo', 'House', 'Techno', 'Soul', 'Rap', 'Indie', 'Punk', 'Gospel', 'MPB']
+STATES = ['NY', 'CA', 'TX', 'FL', 'MA', 'WA', 'IL', 'PA', 'OH', 'GA', 'SP', 'RJ', 'MG', 'BA', 'PR']
+
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'easy_event.settings')
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """
+    Runs the block against a throwaway database created the same way the
+    test runner does, so benchmarks never touch the configured database.
+    """
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    # The cache outlives the throwaway database; nothing in it applies.
+    cache.clear()
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def seed(events=1000, artists=200, owners=20, addresses=500, feedbacks=0, seed_value=42, batch_size=10000):
+    """
+    Bulk-inserts a deterministic synthetic dataset: users, addresses, events
+    with music styles, lineups and candidatures, and optionally feedbacks.
+    """
+    from adresses.dedup import FINGERPRINT_FIELDS, address_fingerprint
+    from adresses.geo import grid_cell
+    from adresses.models import AdressesModel
+    from django.utils import timezone
+    from events.models import EventModel, LineupEventModel, RepeatEvent
+    from events.occurrences import refresh_next_occurrences
+    from feedbacks.models import FeedbackModel
+    from music_styles.models import MusicStyleModel
+    from rest_framework.authtoken.models import Token
+    from users.models import RatingSummaryModel, User
+
+    rand = random.Random(seed_value)
+    now = timezone.now()
+
+    User.objects.bulk_create([
+        User(username=f'owner{index}', email=f'owner{index}@example.com', password='!', is_superuser=True)
+        for index in range(owners)
+    ] + [
+        User(username=f'artist{index}', email=f'artist{index}@example.com', password='!', is_superuser=False,
+             phone=f'{index:011d}', solo=bool(index % 2), hour_price=float(rand.randint(50, 500)))
+        for index in range(artists)
+    ], batch_size=batch_size)
+    owner_ids = list(User.objects.filter(is_superuser=True).values_list('id', flat=True))
+    artist_ids = list(User.objects.filter(is_superuser=False).values_list('id', flat=True))
+    RatingSummaryModel.objects.bulk_create([RatingSummaryModel(user_id=user_id) for user_id in owner_ids + artist_ids],
+                                           batch_size=batch_size)
+    Token.objects.bulk_create([Token(key=f'{user_id:040d}', user_id=user_id) for user_id in owner_ids + artist_ids],
+                              batch_size=batch_size)
+
+    coordinates = [(rand.uniform(-34, 5), rand.uniform(-74, -35)) for _ in range(addresses)]
+    address_rows = [
+        AdressesModel(street=f'Street {index}', neighbourhood=f'Neighbourhood {index % 50}', number=index,
+                      city=f'City {index % (addresses // 5 or 1)}', state=STATES[index % len(STATES)], country='Country',
+                      latitude=latitude, longitude=longitude, grid_cell=grid_cell(latitude, longitude))
+        for index, (latitude, longitude) in enumerate(coordinates)
+    ]
+    for address in address_rows:
+        address.fingerprint = address_fingerprint({field: getattr(address, field) for field in FINGERPRINT_FIELDS})
+    AdressesModel.objects.bulk_create(address_rows, batch_size=batch_size)
+    address_ids = list(AdressesModel.objects.values_list('id', flat=True))
+
+    MusicStyleModel.objects.bulk_create([MusicStyleModel(name=name) for name in MUSIC_STYLES])
+    style_ids = list(MusicStyleModel.objects.values_list('id', flat=True))
+
+    repeat_choices = [RepeatEvent.NULL] * 8 + [RepeatEvent.WEEKLY, RepeatEvent.MONTHLY]
+    for start in range(0, events, batch_size):
+        EventModel.objects.bulk_create([
+            EventModel(datetime=now + timedelta(minutes=rand.randint(-60 * 24 * 30, 60 * 24 * 365)),
+                       repeat_event=rand.choice(repeat_choices), address_id=rand.choice(address_ids),
+                       owner_id=rand.choice(owner_ids), details=f'Event {index} with live music',
+                       base_price=round(rand.uniform(0, 300), 2))
+            for index in range(start, min(start + batch_size, events))
+        ])
+    refresh_next_occurrences(now)
+
+    styles_through = EventModel.music_styles.through
+    candidatures_through = EventModel.candidatures.through
+    event_rows = EventModel.objects.values_list('id', 'datetime', 'owner_id').iterator(chunk_size=batch_size)
+    styles, candidatures, lineups, feedback_rows = [], [], [], []
+
+    def flush(force=False):
+        for model, rows in ((styles_through, styles), (candidatures_through, candidatures),
+                            (LineupEventModel, lineups), (FeedbackModel, feedback_rows)):
+            if rows and (force or len(rows) >= batch_size):
+                model.objects.bulk_create(rows, ignore_conflicts=True)
+                rows.clear()
+
+    feedback_ratio = feedbacks / events if events else 0
+    for event_id, event_datetime, owner_id in event_rows:
+        for style_id in rand.sample(style_ids, rand.randint(1, 3)):
+            styles.append(styles_through(eventmodel_id=event_id, musicstylemodel_id=style_id))
+
+        performers = rand.sample(artist_ids, min(len(artist_ids), 4))
+        for artist_id in performers[:2]:
+            candidatures.append(candidatures_through(eventmodel_id=event_id, user_id=artist_id))
+        for artist_id in performers[2:]:
+            lineups.append(LineupEventModel(event_id=event_id, artist_id=artist_id, performance_datetime=event_datetime))
+            if rand.random() < feedback_ratio:
+                feedback_rows.append(FeedbackModel(from_user_id=owner_id, addressed_user_id=artist_id, event_id=event_id,
+                                                   description='Great show', stars=rand.randint(1, 5)))
+        flush()
+    flush(force=True)
+
+    return {
+        'owner_ids': owner_ids,
+        'artist_ids': artist_ids,
+        'tokens': {user_id: f'{user_id:040d}' for user_id in owner_ids + artist_ids},
+    }
+
+
+def measure(function, repeat):
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(durations):
+    return {
+        'p50_ms': percentile(durations, 50) * 1000,
+        'p95_ms': percentile(durations, 95) * 1000,
+        'p99_ms': percentile(durations, 99) * 1000,
+        'mean_ms': statistics.mean(durations) * 1000,
+    }
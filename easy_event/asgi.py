@@ -9,8 +9,20 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'easy_event.settings')
 
-application = get_asgi_application()
+
+class AsyncRoutesRequest(ASGIRequest):
+    urlconf = 'easy_event.asgi_urls'
+
+
+class AsyncRoutesHandler(ASGIHandler):
+    request_class = AsyncRoutesRequest
+
+
+django.setup(set_prefix=False)
+
+application = AsyncRoutesHandler()
@@ -0,0 +1,13 @@
+"""
+URL configuration for the ASGI entrypoint: the same routes as
+``easy_event.urls``, with the event feed, feedback list and artist
+directory served by async views.
+"""
+from events.views import EventView
+from feedbacks.views import get_feedbacks
+from users.views import get_artists
+
+from easy_event.async_views import async_read_patterns
+from easy_event.urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = async_read_patterns(sync_urlpatterns, [EventView, get_feedbacks, get_artists])
@@ -0,0 +1,57 @@
+"""
+Async read views for the ASGI entrypoint.
+
+Django 3.2 has no async ORM, and under ASGI it runs every sync view on one
+shared thread, so a slow query holds up all other requests. The wrappers
+here keep the event loop free by running the read methods of an existing
+view in the thread pool (``thread_sensitive=False``), each call with its own
+database connection. Writes keep Django's default single-thread behaviour.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.urls import URLPattern, URLResolver
+from easy_event.instrumentation import instrument_connections
+
+READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def run_read_view(view, request, *args, **kwargs):
+    close_old_connections()
+    try:
+        instrument_connections()
+        response = view(request, *args, **kwargs)
+        if hasattr(response, 'render') and callable(response.render):
+            response.render()
+        return response
+    finally:
+        close_old_connections()
+
+
+def async_read_view(view):
+    @functools.wraps(view)
+    async def async_view(request, *args, **kwargs):
+        if request.method in READ_METHODS:
+            return await sync_to_async(run_read_view, thread_sensitive=False)(view, request, *args, **kwargs)
+        return await sync_to_async(view, thread_sensitive=True)(request, *args, **kwargs)
+
+    return async_view
+
+
+def async_read_patterns(patterns, views):
+    """
+    Copies ``patterns`` with the callbacks of ``views`` (view functions or
+    the classes behind them) wrapped by ``async_read_view``.
+    """
+    async_patterns = []
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            pattern = URLResolver(pattern.pattern, async_read_patterns(pattern.url_patterns, views),
+                                  pattern.default_kwargs, pattern.app_name, pattern.namespace)
+        elif pattern.callback in views or getattr(pattern.callback, 'cls', None) in views:
+            pattern = URLPattern(pattern.pattern, async_read_view(pattern.callback), pattern.default_args, pattern.name)
+        async_patterns.append(pattern)
+
+    return async_patterns
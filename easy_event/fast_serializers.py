@@ -0,0 +1,170 @@
+"""
+Precompiled read path for hot list endpoints.
+
+A serializer is compiled once into the ``values()`` columns it reads and a
+row-to-dict function reproducing its ``to_representation`` output, so lists
+can be built from plain rows without instantiating models or walking the
+DRF field machinery per object. Only plain model fields, primary keys and
+nested serializers over foreign keys or many-to-many relations are
+supported; anything else raises ``ImproperlyConfigured`` when compiled.
+
+The path is opt-in through the ``FAST_READ_SERIALIZERS`` setting.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+
+# Fields whose to_representation returns values() output unchanged.
+PASSTHROUGH_FIELDS = (serializers.IntegerField, serializers.CharField, serializers.EmailField,
+                      serializers.FloatField, serializers.BooleanField)
+
+_compiled = {}
+
+
+def fast_reads_enabled():
+    return getattr(settings, 'FAST_READ_SERIALIZERS', False)
+
+
+class SerializerReader:
+    """
+    Reads through the serializer itself; same interface as the compiled one.
+    """
+    def __init__(self, serializer_class, **kwargs):
+        self.serializer_class = serializer_class
+        self.kwargs = kwargs
+
+    def values(self, queryset, *extra):
+        return queryset
+
+    def serialize(self, instances):
+        return self.serializer_class(instances, many=True, **self.kwargs).data
+
+
+class CompiledSerializer:
+    def __init__(self, serializer, model=None):
+        self.model = model or serializer.Meta.model
+        self.pk_column = self.model._meta.pk.attname
+        self.columns = [self.pk_column]
+        self.many = []
+        self.represent = self._compile(serializer, self.model, '')
+
+    def values(self, queryset, *extra):
+        """
+        Turns ``queryset`` into the rows this serializer reads. ``extra``
+        names columns or annotations the caller needs too, such as the
+        cursor pagination ordering.
+        """
+        columns = [*self.columns, *(column for column in extra if column not in self.columns)]
+
+        return queryset.prefetch_related(None).values(*columns)
+
+    def serialize(self, rows):
+        rows = list(rows)
+        ids = [row[self.pk_column] for row in rows]
+        related = [(name, self._fetch_many(field, child, ids)) for name, field, child in self.many]
+
+        data = []
+        for row in rows:
+            item = self.represent(row)
+            for name, groups in related:
+                item[name] = groups.get(row[self.pk_column], [])
+            data.append(item)
+        return data
+
+    def _fetch_many(self, field, child, ids):
+        related_name = field.related_query_name()
+        rows = field.related_model.objects.filter(**{f'{related_name}__in': ids}).values(related_name, *child.columns)
+
+        groups = defaultdict(list)
+        for row in rows:
+            groups[row[related_name]].append(child.represent(row))
+        return groups
+
+    def _compile(self, serializer, model, prefix):
+        readers = []
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if isinstance(field, serializers.ListSerializer):
+                if prefix:
+                    raise ImproperlyConfigured(f'{name}: nested many-to-many relations are not supported.')
+                model_field = self._model_field(model, field, name)
+                self.many.append((name, model_field, CompiledSerializer(field.child, model_field.related_model)))
+                readers.append((name, _constant([])))
+
+            elif isinstance(field, serializers.BaseSerializer):
+                model_field = self._model_field(model, field, name)
+                column = self._column(prefix + field.source)
+                nested = self._compile(field, model_field.related_model, f'{prefix}{field.source}__')
+                readers.append((name, _nested(column, nested)))
+
+            else:
+                model_field = self._model_field(model, field, name)
+                if model_field.is_relation and not (model_field.concrete and isinstance(field, PrimaryKeyRelatedField)
+                                                    and field.pk_field is None):
+                    raise ImproperlyConfigured(f'{name}: only primary keys of foreign keys are supported.')
+
+                convert = None if model_field.is_relation or type(field) in PASSTHROUGH_FIELDS else field.to_representation
+                readers.append((name, _plain(self._column(prefix + field.source), convert)))
+
+        def represent(row):
+            return {name: read(row) for name, read in readers}
+
+        return represent
+
+    def _model_field(self, model, field, name):
+        if isinstance(field, serializers.SerializerMethodField) or '.' in field.source or field.source == '*':
+            raise ImproperlyConfigured(f'{name}: only model fields can be compiled.')
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(f'{name}: {model.__name__}.{field.source} is not a model field.')
+
+        if isinstance(field, serializers.ListSerializer) != bool(model_field.many_to_many and model_field.concrete):
+            raise ImproperlyConfigured(f'{name}: many=True is only supported on many-to-many fields.')
+        return model_field
+
+    def _column(self, column):
+        if column not in self.columns:
+            self.columns.append(column)
+        return column
+
+
+def _constant(value):
+    return lambda row: value
+
+
+def _plain(column, convert):
+    if convert is None:
+        return lambda row: row[column]
+
+    def read(row):
+        value = row[column]
+        return None if value is None else convert(value)
+    return read
+
+
+def _nested(column, represent):
+    def read(row):
+        return None if row[column] is None else represent(row)
+    return read
+
+
+def get_read_serializer(serializer_class, **kwargs):
+    """
+    Returns the compiled reader for ``serializer_class`` when fast reads
+    are enabled, and a reader going through the serializer otherwise.
+    """
+    if not fast_reads_enabled():
+        return SerializerReader(serializer_class, **kwargs)
+
+    key = (serializer_class, repr(sorted(kwargs.items())))
+    if key not in _compiled:
+        _compiled[key] = CompiledSerializer(serializer_class(**kwargs))
+    return _compiled[key]
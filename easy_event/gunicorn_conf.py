@@ -0,0 +1,60 @@
+"""
+Gunicorn configuration: ``gunicorn --config python:easy_event.gunicorn_conf``.
+
+Environment variables:
+
+- ``GUNICORN_WORKER_CLASS``: ``sync`` (default), ``gthread``, or ``asgi``
+  for ``easy_event.asgi`` under uvicorn workers.
+- ``WEB_CONCURRENCY``: worker processes (2); ``GUNICORN_THREADS``: threads
+  per gthread worker (4).
+- ``GUNICORN_PRELOAD``: ``0`` to import the app in each worker instead of
+  once in the master before forking.
+- ``GUNICORN_WARM_UP``: ``0`` to skip warming workers before they serve.
+"""
+import glob
+import os
+import tempfile
+
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    'asgi': 'uvicorn.workers.UvicornWorker',
+}
+
+worker_type = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+if worker_type not in WORKER_CLASSES:
+    raise RuntimeError(f'GUNICORN_WORKER_CLASS must be one of {", ".join(WORKER_CLASSES)}, not {worker_type!r}.')
+
+wsgi_app = 'easy_event.asgi:application' if worker_type == 'asgi' else 'easy_event.wsgi:application'
+worker_class = WORKER_CLASSES[worker_type]
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 4)) if worker_type == 'gthread' else 1
+bind = f'0.0.0.0:{os.environ.get("PORT", 8000)}'
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+warm_workers = os.environ.get('GUNICORN_WARM_UP', '1') == '1'
+
+# Every worker writes its /api/metrics counters here; see easy_event.metrics.
+os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'easy_event_metrics'))
+
+
+def on_starting(server):
+    for snapshot in glob.glob(os.path.join(os.environ['METRICS_DIR'], '*.json')):
+        os.remove(snapshot)
+
+
+def when_ready(server):
+    # With preload the master warms what forked workers inherit, and closes
+    # its connections so no worker shares a socket with it.
+    if preload_app and warm_workers:
+        from django.db import connections
+        from easy_event.warmup import warm_up
+
+        server.log.info('Warmed master: %s', warm_up(connect=False))
+        connections.close_all()
+
+
+def post_worker_init(worker):
+    if warm_workers:
+        from easy_event.warmup import warm_up
+
+        worker.log.info('Warmed worker %s: %s', worker.pid, warm_up())
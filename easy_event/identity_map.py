@@ -0,0 +1,37 @@
+from django.contrib.auth import get_user_model
+from django.http import Http404
+
+
+def _get_identity_map(request):
+    request = getattr(request, '_request', request)
+
+    if not hasattr(request, '_identity_map'):
+        request._identity_map = {}
+
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            request._identity_map[(get_user_model()._meta.label, user.pk)] = user
+
+    return request._identity_map
+
+
+def get_request_object(request, model, pk):
+    """
+    Returns the ``model`` instance with primary key ``pk``, loading it at most
+    once per request so permissions and views share the same instance.
+
+    Raises ``model.DoesNotExist`` like ``QuerySet.get``.
+    """
+    identity_map = _get_identity_map(request)
+    key = (model._meta.label, model._meta.pk.to_python(pk))
+
+    if key not in identity_map:
+        identity_map[key] = model.objects.get(pk=key[1])
+    return identity_map[key]
+
+
+def get_request_object_or_404(request, model, pk):
+    try:
+        return get_request_object(request, model, pk)
+    except model.DoesNotExist:
+        raise Http404
@@ -0,0 +1,162 @@
+"""
+Per-request SQL instrumentation.
+
+``QueryInstrumentationMiddleware`` counts the queries each request runs and
+sums their database time through a connection execute wrapper, so it works
+with ``DEBUG`` off. The totals are sent back in a ``Server-Timing`` header
+and, with ``SQL_INSTRUMENTATION_LOG``, logged to ``easy_event.sql``.
+
+The middleware is off unless the ``SQL_INSTRUMENTATION`` setting is set; it
+then removes itself from the middleware chain and costs nothing. It runs
+natively in both the WSGI and the ASGI chain, so turning it on does not
+send ASGI requests through Django's single sync thread.
+"""
+import asyncio
+import contextlib
+import logging
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger('easy_event.sql')
+
+_active_stats = ContextVar('sql_query_stats', default=None)
+
+
+def instrumentation_enabled():
+    return getattr(settings, 'SQL_INSTRUMENTATION', False)
+
+
+class QueryStats:
+    """
+    Execute wrapper adding up the queries it sees. With ``statements`` set
+    to a list it also keeps each statement and its duration.
+    """
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.duration += duration
+            self.count += 1
+            if self.statements is not None:
+                self.statements.append((sql, duration))
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _active_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats(execute, sql, params, many, context)
+
+
+def _install(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def instrument_connections():
+    """
+    Routes the queries of this thread's connections, and of every
+    connection opened from now on, to the collector of the current
+    context. The collector follows the context into the threads
+    ``sync_to_async`` runs views on, so queries are counted wherever the
+    view runs. Nothing is installed outside a collector.
+    """
+    if _active_stats.get() is None:
+        return
+
+    connection_created.connect(_install, dispatch_uid='easy_event.instrumentation')
+    for connection in connections.all():
+        _install(connection)
+
+
+@contextlib.contextmanager
+def collect_queries(statements=False):
+    """
+    Collects the queries run inside the block, joining the collector of an
+    enclosing block when there is one. ``statements`` keeps the SQL too.
+    """
+    stats = _active_stats.get()
+    if stats is not None:
+        if statements and stats.statements is None:
+            stats.statements = []
+        yield stats
+        return
+
+    stats = QueryStats()
+    if statements:
+        stats.statements = []
+    token = _active_stats.set(stats)
+    try:
+        instrument_connections()
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def mark_async(middleware, get_response):
+    """
+    Lets Django call ``middleware`` directly from an async chain, as
+    ``MiddlewareMixin`` does, instead of adapting it onto the sync thread.
+    """
+    if asyncio.iscoroutinefunction(get_response):
+        middleware._is_coroutine = asyncio.coroutines._is_coroutine
+
+
+class QueryInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not instrumentation_enabled():
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.log = getattr(settings, 'SQL_INSTRUMENTATION_LOG', False)
+        mark_async(self, get_response)
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start = time.perf_counter()
+        with collect_queries() as stats:
+            response = self.get_response(request)
+        return self.finish(request, response, stats, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        with collect_queries() as stats:
+            response = await self.get_response(request)
+        return self.finish(request, response, stats, time.perf_counter() - start)
+
+    def finish(self, request, response, stats, total):
+        timing = f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", total;dur={total * 1000:.2f}'
+        if response.has_header('Server-Timing'):
+            timing = f'{response["Server-Timing"]}, {timing}'
+        response['Server-Timing'] = timing
+
+        if self.log:
+            self.log_request(request, response, stats, total)
+        return response
+
+    def log_request(self, request, response, stats, total):
+        fields = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': stats.count,
+            'db_ms': round(stats.duration * 1000, 2),
+            'total_ms': round(total * 1000, 2),
+        }
+        logger.info(' '.join(f'{key}={value}' for key, value in fields.items()), extra=fields)
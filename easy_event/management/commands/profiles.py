@@ -0,0 +1,66 @@
+import io
+import json
+import os
+import pstats
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from easy_event.profiling import get_profiling_dir, list_profiles
+
+
+class Command(BaseCommand):
+    help = 'Lists the stored request profiles, or summarizes the one given.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('profile_id', nargs='?')
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--sort', choices=['cumulative', 'tottime', 'ncalls'], default='cumulative')
+
+    def handle(self, *args, **options):
+        directory = get_profiling_dir()
+        if not directory:
+            raise CommandError('PROFILING_DIR is not set.')
+
+        if options['profile_id']:
+            self.summarize(directory, options['profile_id'], options['limit'], options['sort'])
+        else:
+            self.list(directory, options['limit'])
+
+    def list(self, directory, limit):
+        profiles = list_profiles(directory) if os.path.isdir(directory) else []
+        if not profiles:
+            self.stdout.write('No profiles stored.')
+            return
+
+        self.stdout.write(f'{"id":<33} {"status":>6} {"ms":>9} {"queries":>7}  request')
+        for profile in profiles[:limit]:
+            self.stdout.write(f'{profile["id"]:<33} {profile["status"]:>6} {profile["duration_ms"]:>9.2f} '
+                              f'{len(profile["queries"]):>7}  {profile["method"]} {profile["path"]} ({profile["view"]})')
+
+    def summarize(self, directory, profile_id, limit, sort):
+        try:
+            with open(os.path.join(directory, f'{profile_id}.json')) as file:
+                profile = json.load(file)
+        except FileNotFoundError:
+            raise CommandError(f'Profile {profile_id} does not exist.')
+
+        queries = profile['queries']
+        self.stdout.write(f'{profile["method"]} {profile["path"]} ({profile["view"]}) -> {profile["status"]} '
+                          f'in {profile["duration_ms"]:.2f} ms, {profile["created"]}')
+        self.stdout.write(f'{len(queries)} queries in {sum(query["duration_ms"] for query in queries):.2f} ms')
+
+        repeated = [(sql, count) for sql, count in Counter(query['sql'] for query in queries).most_common() if count > 1]
+        if repeated:
+            self.stdout.write('\nRepeated statements:')
+            for sql, count in repeated[:limit]:
+                self.stdout.write(f'{count:>5}x  {sql}')
+
+        if queries:
+            self.stdout.write('\nSlowest statements:')
+            for query in sorted(queries, key=lambda query: query['duration_ms'], reverse=True)[:limit]:
+                self.stdout.write(f'{query["duration_ms"]:>9.3f} ms  {query["sql"]}')
+
+        stream = io.StringIO()
+        pstats.Stats(os.path.join(directory, f'{profile_id}.prof'), stream=stream).sort_stats(sort).print_stats(limit)
+        self.stdout.write(stream.getvalue())
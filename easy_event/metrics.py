@@ -0,0 +1,293 @@
+"""
+Prometheus metrics for the API views.
+
+``MetricsMiddleware`` records, per view, the request count by method and
+status code, a latency histogram and the queries run; ``cached_response``
+records its hits and misses. ``/api/metrics`` serves the totals in the
+Prometheus text format.
+
+Each process keeps its own counters and, when the ``METRICS_DIR`` setting
+names a directory, writes them there as a snapshot file at most every
+``METRICS_FLUSH_INTERVAL`` seconds. The endpoint sums the snapshots of all
+processes, so every gunicorn worker answers with the same totals. The
+directory must be shared by the workers and emptied when the server starts.
+Without it the counters only cover the process answering the scrape.
+
+Collection is off unless ``METRICS_ENABLED`` is set: it times every
+request and wraps every query. The endpoint answers 404 while it is off,
+and otherwise only staff users or a scraper sending
+``Authorization: Bearer <METRICS_TOKEN>``.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+from users.authentication import is_staff_request
+
+from easy_event.instrumentation import collect_queries, mark_async
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS = {
+    'easy_event_requests_total': ('counter', 'Requests handled, by view, method and status code.'),
+    'easy_event_request_duration_seconds': ('histogram', 'Request latency in seconds, by view.'),
+    'easy_event_db_queries_total': ('counter', 'Database queries run, by view.'),
+    'easy_event_db_duration_seconds_total': ('counter', 'Time spent in database queries, by view.'),
+    'easy_event_cache_requests_total': ('counter', 'Response cache lookups, by cache and result.'),
+    'easy_event_cache_hit_ratio': ('gauge', 'Share of response cache lookups that were hits.'),
+}
+
+_store = None
+
+
+def metrics_enabled():
+    return getattr(settings, 'METRICS_ENABLED', False)
+
+
+class MetricsStore:
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.pid = os.getpid()
+        self.path = self.directory and os.path.join(self.directory, f'{self.pid}-{uuid.uuid4().hex}.json')
+        self.last_flush = time.monotonic()
+        self.counters = defaultdict(float)
+        self.histograms = {}
+
+    def _check_fork(self):
+        # Workers forked from a preloaded master start from empty counters
+        # and their own snapshot file; the master's are already counted.
+        if os.getpid() != self.pid:
+            self._reset()
+
+    def inc(self, name, labels, amount=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self._check_fork()
+            self.counters[key] += amount
+        self.flush()
+
+    def observe(self, name, labels, value):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self._check_fork()
+            if key not in self.histograms:
+                self.histograms[key] = [[0] * (len(BUCKETS) + 1), 0.0]
+            histogram = self.histograms[key]
+            histogram[0][bisect_left(BUCKETS, value)] += 1
+            histogram[1] += value
+        self.flush()
+
+    def record_request(self, view, method, status_code, duration, queries):
+        with self.lock:
+            self._check_fork()
+            self.counters[('easy_event_requests_total',
+                           (('method', method), ('status', str(status_code)), ('view', view)))] += 1
+            self.counters[('easy_event_db_queries_total', (('view', view),))] += queries.count
+            self.counters[('easy_event_db_duration_seconds_total', (('view', view),))] += queries.duration
+        self.observe('easy_event_request_duration_seconds', {'view': view}, duration)
+
+    def snapshot(self):
+        with self.lock:
+            self._check_fork()
+            return {
+                'counters': [[name, labels, value] for (name, labels), value in self.counters.items()],
+                'histograms': [[name, labels, buckets[:], total] for (name, labels), (buckets, total)
+                               in self.histograms.items()],
+            }
+
+    def flush(self, force=False):
+        if not self.directory or (not force and time.monotonic() - self.last_flush < self.flush_interval):
+            return
+
+        if not self.flush_lock.acquire(blocking=force):
+            return
+        try:
+            self.last_flush = time.monotonic()
+            snapshot = self.snapshot()
+            os.makedirs(self.directory, exist_ok=True)
+            temporary = f'{self.path}.tmp'
+            with open(temporary, 'w') as file:
+                json.dump(snapshot, file)
+            os.replace(temporary, self.path)
+        finally:
+            self.flush_lock.release()
+
+    def collect(self):
+        """
+        Sums the snapshots of every process sharing the directory.
+        """
+        if not self.directory:
+            return merge([self.snapshot()])
+
+        self.flush(force=True)
+        snapshots = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as file:
+                    snapshots.append(json.load(file))
+            except (OSError, ValueError):
+                continue
+        return merge(snapshots)
+
+
+def merge(snapshots):
+    counters = defaultdict(float)
+    histograms = {}
+
+    for snapshot in snapshots:
+        for name, labels, value in snapshot['counters']:
+            counters[(name, tuple(map(tuple, labels)))] += value
+        for name, labels, buckets, total in snapshot['histograms']:
+            key = (name, tuple(map(tuple, labels)))
+            merged = histograms.setdefault(key, [[0] * len(buckets), 0.0])
+            merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+            merged[1] += total
+
+    return counters, histograms
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_metrics(counters, histograms):
+    samples = defaultdict(list)
+
+    for (name, labels), value in sorted(counters.items()):
+        samples[name].append(f'{name}{_labels(labels)} {_number(value)}')
+
+    for (name, labels), (buckets, total) in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip((*BUCKETS, '+Inf'), buckets):
+            cumulative += count
+            samples[name].append(f'{name}_bucket{_labels((*labels, ("le", bound)))} {cumulative}')
+        samples[name].append(f'{name}_sum{_labels(labels)} {_number(total)}')
+        samples[name].append(f'{name}_count{_labels(labels)} {cumulative}')
+
+    lookups = defaultdict(lambda: {'hit': 0, 'miss': 0})
+    for (name, labels), value in counters.items():
+        if name == 'easy_event_cache_requests_total':
+            labels = dict(labels)
+            lookups[labels['cache']][labels['result']] += value
+    for cache, results in sorted(lookups.items()):
+        ratio = results['hit'] / (results['hit'] + results['miss'])
+        samples['easy_event_cache_hit_ratio'].append(f'easy_event_cache_hit_ratio{_labels((("cache", cache),))} '
+                                                     f'{_number(ratio)}')
+
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        if samples[name]:
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} {kind}', *samples[name]]
+    return '\n'.join(lines) + '\n'
+
+
+def get_store():
+    global _store
+
+    if _store is None:
+        _store = MetricsStore(getattr(settings, 'METRICS_DIR', None), getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0))
+    return _store
+
+
+@receiver(setting_changed)
+def reset_store(setting, **kwargs):
+    global _store
+
+    if setting in ('METRICS_DIR', 'METRICS_FLUSH_INTERVAL'):
+        _store = None
+
+
+def record_cache_lookup(cache, hit):
+    if metrics_enabled():
+        get_store().inc('easy_event_cache_requests_total', {'cache': cache, 'result': 'hit' if hit else 'miss'})
+
+
+def view_name(request):
+    match = request.resolver_match
+    if match is None:
+        return 'unmatched'
+
+    view = getattr(match.func, 'cls', match.func)
+    actions = getattr(match.func, 'actions', None)
+    if actions and request.method.lower() in actions:
+        return f'{view.__name__}.{actions[request.method.lower()]}'
+    return view.__name__
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not metrics_enabled():
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        mark_async(self, get_response)
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start = time.perf_counter()
+        with collect_queries() as queries:
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        get_store().record_request(view_name(request), request.method, response.status_code, duration, queries)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        with collect_queries() as queries:
+            response = await self.get_response(request)
+        duration = time.perf_counter() - start
+
+        get_store().record_request(view_name(request), request.method, response.status_code, duration, queries)
+        return response
+
+
+def _has_scrape_token(request):
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    keyword, _, credentials = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+
+    return bool(token) and keyword == 'Bearer' and constant_time_compare(credentials, token)
+
+
+@require_GET
+def metrics(request):
+    if not metrics_enabled():
+        raise Http404
+    if not _has_scrape_token(request) and not is_staff_request(request):
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(*get_store().collect()), content_type=CONTENT_TYPE)
@@ -0,0 +1,152 @@
+"""
+On-demand request profiling.
+
+A staff user can ask for any request to be profiled with an ``X-Profile: 1``
+header or a ``profile=1`` query parameter. ``ProfilingMiddleware`` then runs
+it under ``cProfile`` and saves, in the ``PROFILING_DIR`` directory:
+
+- ``<id>.prof``, the call tree as ``pstats`` data (readable by ``pstats``,
+  snakeviz and the like);
+- ``<id>.json``, the request, its timing and the SQL it issued.
+
+The id is returned in the ``X-Profile-Id`` header. Only the newest
+``PROFILING_MAX_PROFILES`` profiles are kept, and one request is profiled at
+a time; others arriving meanwhile are served normally. ``manage.py
+profiles`` lists and summarizes them.
+
+The profiler follows one thread. Under ASGI a profiled request is moved to
+Django's sync thread, where sync views run too; the read views handed to
+the thread pool only show up through their SQL. Requests that are not
+profiled stay on the event loop. Streamed response bodies are produced
+after the profiler stops.
+Without ``PROFILING_DIR`` the middleware is not used.
+"""
+import asyncio
+import cProfile
+import json
+import os
+import threading
+import time
+import uuid
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+from users.authentication import is_staff_request
+
+from easy_event.instrumentation import collect_queries, mark_async
+from easy_event.metrics import view_name
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_PARAMETER = 'profile'
+
+_profiling = threading.Lock()
+
+
+def get_profiling_dir():
+    return getattr(settings, 'PROFILING_DIR', None)
+
+
+def get_max_profiles():
+    return getattr(settings, 'PROFILING_MAX_PROFILES', 50)
+
+
+def list_profiles(directory):
+    """
+    Returns the metadata of the stored profiles, newest first.
+    """
+    profiles = []
+
+    for name in sorted(os.listdir(directory), reverse=True):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(directory, name)) as file:
+                profiles.append(json.load(file))
+        except (OSError, ValueError):
+            continue
+    return profiles
+
+
+def prune_profiles(directory, keep):
+    ids = sorted((name[:-len('.json')] for name in os.listdir(directory) if name.endswith('.json')), reverse=True)
+
+    for profile_id in ids[keep:]:
+        for extension in ('.json', '.prof'):
+            try:
+                os.remove(os.path.join(directory, profile_id + extension))
+            except FileNotFoundError:
+                pass
+
+
+def _profile_requested(request):
+    return request.META.get(PROFILE_HEADER) == '1' or request.GET.get(PROFILE_PARAMETER) == '1'
+
+
+class ProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.directory = get_profiling_dir()
+        if not self.directory:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.max_profiles = get_max_profiles()
+        mark_async(self, get_response)
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not _profile_requested(request) or not is_staff_request(request) \
+                or not _profiling.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            return self.profile(request, self.get_response)
+        finally:
+            _profiling.release()
+
+    async def __acall__(self, request):
+        if not _profile_requested(request) or not await sync_to_async(is_staff_request)(request) \
+                or not _profiling.acquire(blocking=False):
+            return await self.get_response(request)
+
+        try:
+            return await sync_to_async(self.profile)(request, async_to_sync(self.get_response))
+        finally:
+            _profiling.release()
+
+    def profile(self, request, get_response):
+        profiler = cProfile.Profile()
+        started_at = timezone.now()
+        start = time.perf_counter()
+
+        with collect_queries(statements=True) as queries:
+            profiler.enable()
+            try:
+                response = get_response(request)
+            finally:
+                profiler.disable()
+        duration = time.perf_counter() - start
+
+        profile_id = f'{started_at:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}'
+        os.makedirs(self.directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(self.directory, f'{profile_id}.prof'))
+        with open(os.path.join(self.directory, f'{profile_id}.json'), 'w') as file:
+            json.dump({
+                'id': profile_id,
+                'created': started_at.isoformat(),
+                'method': request.method,
+                'path': request.get_full_path(),
+                'view': view_name(request),
+                'status': response.status_code,
+                'duration_ms': round(duration * 1000, 2),
+                'queries': [{'sql': sql, 'duration_ms': round(elapsed * 1000, 3)} for sql, elapsed in queries.statements],
+            }, file, indent=2)
+        prune_profiles(self.directory, self.max_profiles)
+
+        response['X-Profile-Id'] = profile_id
+        return response
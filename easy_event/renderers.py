@@ -0,0 +1,62 @@
+import re
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+# repr and orjson write some floats differently: 1e+16 and 1e-07 against
+# 1e16 and 1e-7, and 1e-05 against 0.00001. The candidate patterns start
+# with a literal, so they scan fast, and mostly hit inside strings; the
+# second confirms a number token starts right before. A string that merely
+# looks like one only costs a fallback.
+FLOAT_CANDIDATES = (re.compile(rb'e[-0-9][0-9]*(?:[,\]}]|\Z)'), re.compile(rb'\.0000[1-9]'))
+FLOAT_NUMBER = re.compile(rb'(?:\A|[:,\[])-?(?:[0-9]+(?:\.[0-9]+)?e|0\.0000[1-9])')
+LONGEST_MANTISSA = 32
+
+
+def encode_default(obj):
+    return JSONEncoder().default(obj)
+
+
+def has_unlike_float(rendered):
+    for pattern in FLOAT_CANDIDATES:
+        for candidate in pattern.finditer(rendered):
+            if FLOAT_NUMBER.search(rendered, max(0, candidate.start() - LONGEST_MANTISSA), candidate.end()):
+                return True
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renders JSON with orjson, byte for byte like DRF's JSONRenderer with
+    the default compact and unicode settings. datetime, UUID and dict or
+    list subclasses are encoded natively; Decimal, lazy strings and the
+    rest fall back to DRF's JSONEncoder. Indented output, non-default JSON
+    settings, floats orjson writes differently (see FLOAT_CANDIDATES) and
+    integers wider than 64 bits are left to JSONRenderer.
+
+    The one difference: NaN and Infinity render as null, where JSONRenderer
+    raises ValueError.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=encode_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Integers past 64 bits, or values JSONRenderer rejects too.
+            return super().render(data, accepted_media_type, renderer_context)
+        if has_unlike_float(ret):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for separator, escaped in LINE_SEPARATORS:
+            if separator in ret:
+                ret = ret.replace(separator, escaped)
+        return ret
@@ -45,6 +45,7 @@ THIRD_PARTY_APPS = [
 ]
 
 MY_APPS = [
+    'easy_event',
     'adresses',
     'events',
     'feedbacks',
@@ -55,11 +56,14 @@ MY_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + MY_APPS
 
 MIDDLEWARE = [
+    'easy_event.metrics.MetricsMiddleware',
+    'easy_event.instrumentation.QueryInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'easy_event.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -90,6 +94,7 @@ WSGI_APPLICATION = 'easy_event.wsgi.application'
 
 import dj_database_url
 import os
+import tempfile
 
 DATABASES = {
     'default': {
@@ -105,6 +110,17 @@ if DATABASE_URL:
     DATABASES['default'].update(db_from_env)
     DEBUG = False
 
+# Cache shared by the worker processes: the events response cache and the
+# token revocation markers must be seen by every worker. The file backend
+# covers the workers of one host; set CACHE_BACKEND and CACHE_LOCATION to a
+# memcached server when running on several hosts.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', os.path.join(tempfile.gettempdir(), 'easy_event_cache')),
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -148,4 +164,41 @@ STATIC_URL = '/static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-AUTH_USER_MODEL = 'users.User'
\ No newline at end of file
+AUTH_USER_MODEL = 'users.User'
+
+# Per-request query counts and database time in Server-Timing headers.
+SQL_INSTRUMENTATION = os.environ.get('SQL_INSTRUMENTATION') == '1'
+SQL_INSTRUMENTATION_LOG = os.environ.get('SQL_INSTRUMENTATION_LOG') == '1'
+
+# /api/metrics collection costs a timer and a query wrapper per request.
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED') == '1'
+# Directory shared by the worker processes for the /api/metrics counters.
+METRICS_DIR = os.environ.get('METRICS_DIR')
+# Bearer token for scrapers; staff users can read the metrics without it.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+# Directory for on-demand request profiles; profiling is off without it.
+PROFILING_DIR = os.environ.get('PROFILING_DIR')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'easy_event.sql': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+    },
+}
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'easy_event.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'easy_event.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
\ No newline at end of file
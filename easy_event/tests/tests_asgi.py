@@ -0,0 +1,101 @@
+import asyncio
+import tempfile
+import threading
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import path
+from django.test import AsyncClient, Client, RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from easy_event.async_views import async_read_view
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from users.models import User
+
+
+_barrier = None
+
+
+def meet_other_request(request):
+    _barrier.wait()
+    return HttpResponse()
+
+
+# ROOT_URLCONF of TestMiddlewareKeepsConcurrency.
+urlpatterns = [path('api/slow', async_read_view(meet_other_request))]
+
+
+class TestAsyncReadView(SimpleTestCase):
+    async def test_reads_run_concurrently_off_the_sync_thread(self):
+        barrier = threading.Barrier(2, timeout=5)
+        sync_thread = threading.get_ident()
+
+        def slow_read(request):
+            barrier.wait()
+            return HttpResponse(str(threading.get_ident() != sync_thread))
+
+        view = async_read_view(slow_read)
+        responses = await asyncio.gather(view(RequestFactory().get('/')), view(RequestFactory().get('/')))
+
+        self.assertEqual([response.content for response in responses], [b'True', b'True'])
+
+    async def test_writes_keep_the_sync_thread(self):
+        threads = set()
+
+        def write(request):
+            threads.add(threading.get_ident())
+            return HttpResponse(status=201)
+
+        view = async_read_view(write)
+        await asyncio.gather(view(RequestFactory().post('/')), view(RequestFactory().post('/')))
+
+        self.assertEqual(len(threads), 1)
+
+
+class TestMiddlewareKeepsConcurrency(SimpleTestCase):
+    async def test_instrumented_requests_run_concurrently(self):
+        global _barrier
+        _barrier = threading.Barrier(2, timeout=5)
+
+        with tempfile.TemporaryDirectory() as directory, \
+                override_settings(ROOT_URLCONF=__name__, METRICS_ENABLED=True, SQL_INSTRUMENTATION=True,
+                                  PROFILING_DIR=directory, METRICS_DIR=None):
+            responses = await asyncio.gather(AsyncClient().get('/api/slow'), AsyncClient().get('/api/slow'))
+
+        self.assertEqual([response.status_code for response in responses], [200, 200])
+        self.assertTrue(all(response.has_header('Server-Timing') for response in responses))
+
+
+class TestAsyncRoutes(TransactionTestCase):
+    def setUp(self) -> None:
+        owner = User.objects.create_user(username='owner', email='owner@example.com', password='123', is_superuser=True)
+        artist = User.objects.create_user(username='artist', email='artist@example.com', password='123',
+                                          hour_price=100, solo=True)
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=owner).key}')
+        for days in (1, 2):
+            client.post('/api/events/', {
+                'datetime': timezone.now() + timezone.timedelta(days=days),
+                'repeat_event': 'None',
+                'details': 'details',
+                'base_price': 9.99,
+                'address': {'street': 'E 39th St', 'neighbourhood': 'Murray Hill', 'number': 39,
+                            'city': 'New York', 'state': 'NY', 'country': 'New York'},
+                'music_styles': [{'name': 'Rock'}],
+            }, format='json')
+
+        self.token = Token.objects.create(user=artist).key
+
+    async def test_async_routes_match_sync_routes(self):
+        for path in ('/api/events/', '/api/events/1/', '/api/events/occurrences/', '/api/feedbacks/',
+                     '/api/accounts/artists/', '/api/accounts/owners/'):
+            sync_response = await sync_to_async(Client().get)(path, HTTP_AUTHORIZATION=f'Token {self.token}')
+            cache.clear()
+
+            with override_settings(ROOT_URLCONF='easy_event.asgi_urls'):
+                async_response = await AsyncClient().get(path, authorization=f'Token {self.token}')
+
+            self.assertEqual(async_response.status_code, 200, path)
+            self.assertEqual(async_response.content, sync_response.content, path)
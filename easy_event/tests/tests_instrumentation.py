@@ -0,0 +1,68 @@
+import re
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from users.models import User
+
+SERVER_TIMING = re.compile(r'^db;dur=\d+\.\d{2};desc="(\d+) queries", total;dur=\d+\.\d{2}$')
+
+
+def queries_in(response):
+    match = SERVER_TIMING.match(response['Server-Timing'])
+    return int(match.group(1))
+
+
+class TestQueryInstrumentation(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.artist = User.objects.create_user(username='artist', email='artist@example.com', password='123',
+                                               hour_price=100, solo=True)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.artist).key}')
+
+    def test_disabled_by_default(self):
+        response = self.client.get('/api/accounts/owners/')
+
+        self.assertFalse(response.has_header('Server-Timing'))
+
+    @override_settings(SQL_INSTRUMENTATION=True, DEBUG=False)
+    def test_counts_queries_without_debug(self):
+        response = self.client.get('/api/accounts/owners/')
+        self.assertFalse(connection.queries_logged)
+
+        with self.assertNumQueries(queries_in(response)):
+            self.client.get('/api/accounts/owners/')
+
+    @override_settings(SQL_INSTRUMENTATION=True, SQL_INSTRUMENTATION_LOG=True)
+    def test_logs_one_line_per_request(self):
+        with self.assertLogs('easy_event.sql', 'INFO') as logs:
+            response = self.client.get('/api/accounts/owners/')
+
+        record, = logs.records
+        self.assertEqual((record.method, record.path, record.status), ('GET', '/api/accounts/owners/', 200))
+        self.assertEqual(record.queries, queries_in(response))
+
+
+class TestAsyncQueryInstrumentation(TransactionTestCase):
+    def setUp(self) -> None:
+        artist = User.objects.create_user(username='artist', email='artist@example.com', password='123',
+                                          hour_price=100, solo=True)
+        self.token = Token.objects.create(user=artist).key
+
+    @override_settings(SQL_INSTRUMENTATION=True, ROOT_URLCONF='easy_event.asgi_urls')
+    async def test_counts_queries_of_async_read_views(self):
+        response = await AsyncClient().get('/api/events/', authorization=f'Token {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(queries_in(response), 0)
+
+    @override_settings(SQL_INSTRUMENTATION=True, ROOT_URLCONF='easy_event.asgi_urls')
+    async def test_counts_queries_of_sync_views(self):
+        response = await AsyncClient().post('/api/login/', {'username': 'artist', 'password': '123'},
+                                            content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(queries_in(response), 0)
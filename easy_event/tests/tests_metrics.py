@@ -0,0 +1,105 @@
+import multiprocessing
+import re
+import tempfile
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from easy_event.instrumentation import QueryStats
+from easy_event.metrics import MetricsStore, get_store, render_metrics
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from users.models import User
+
+
+def record_in_worker(directory):
+    store = MetricsStore(directory)
+    store.record_request('EventView.list', 'GET', 200, 0.02, QueryStats())
+    store.flush(force=True)
+
+
+class TestMetricsEndpoint(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(METRICS_ENABLED=True, METRICS_DIR=directory.name, METRICS_TOKEN='scraper')
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        User.objects.create_user(username='artist', email='artist@example.com', password='123',
+                                 hour_price=100, solo=True)
+        staff = User.objects.create_user(username='staff', email='staff@example.com', password='123', is_staff=True)
+        self.client = APIClient()
+        self.staff_client = APIClient()
+        self.staff_client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=staff).key}')
+
+    def sample(self, body, line):
+        match = re.search(rf'^{re.escape(line)} (\S+)$', body, re.MULTILINE)
+        self.assertIsNotNone(match, line)
+        return float(match.group(1))
+
+    def test_reports_requests_latency_queries_and_cache(self):
+        token = self.client.post('/api/login/', {'username': 'artist', 'password': '123'}, format='json').data['token']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        self.client.get('/api/events/')
+        self.client.get('/api/events/')
+        self.client.get('/api/accounts/owners/')
+
+        response = self.staff_client.get('/api/metrics')
+        body = response.content.decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertEqual(self.sample(body, 'easy_event_requests_total{method="POST",status="200",view="login"}'), 1)
+        self.assertEqual(self.sample(body, 'easy_event_requests_total{method="GET",status="200",view="EventView.list"}'), 2)
+        self.assertEqual(self.sample(body, 'easy_event_request_duration_seconds_count{view="EventView.list"}'), 2)
+        self.assertEqual(self.sample(body, 'easy_event_request_duration_seconds_bucket{view="get_owners",le="+Inf"}'), 1)
+        self.assertGreater(self.sample(body, 'easy_event_db_queries_total{view="login"}'), 0)
+        self.assertEqual(self.sample(body, 'easy_event_cache_hit_ratio{cache="events"}'), 0.5)
+        self.assertIn('# TYPE easy_event_request_duration_seconds histogram', body)
+
+    def test_only_staff_and_scrapers_read_metrics(self):
+        token = self.client.post('/api/login/', {'username': 'artist', 'password': '123'}, format='json').data['token']
+
+        self.assertEqual(APIClient().get('/api/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/api/metrics', HTTP_AUTHORIZATION=f'Token {token}').status_code, 403)
+        self.assertEqual(self.client.get('/api/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        self.assertEqual(self.client.get('/api/metrics', HTTP_AUTHORIZATION='Bearer scraper').status_code, 200)
+
+    def test_disabled_metrics_are_neither_collected_nor_served(self):
+        with self.settings(METRICS_ENABLED=False):
+            client = APIClient()
+            client.get('/api/accounts/owners/')
+            response = self.staff_client.get('/api/metrics')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(get_store().collect(), ({}, {}))
+
+    def test_aggregates_worker_processes(self):
+        self.client.get('/api/accounts/owners/')
+        store = get_store()
+        worker = multiprocessing.get_context('fork').Process(target=record_in_worker, args=(store.directory,))
+        worker.start()
+        worker.join()
+
+        counters, histograms = store.collect()
+
+        self.assertEqual(worker.exitcode, 0)
+        self.assertEqual(histograms[('easy_event_request_duration_seconds', (('view', 'EventView.list'),))][0][2], 1)
+        self.assertEqual(counters[('easy_event_requests_total',
+                                   (('method', 'GET'), ('status', '200'), ('view', 'get_owners')))], 1)
+
+
+class TestMetricsStore(SimpleTestCase):
+    def test_forked_store_starts_empty(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = MetricsStore(directory)
+            store.inc('easy_event_requests_total', {'view': 'login'})
+            store.pid = -1
+
+            self.assertEqual(store.snapshot(), {'counters': [], 'histograms': []})
+
+    def test_render_escapes_label_values(self):
+        body = render_metrics({('easy_event_requests_total', (('view', 'a"b\\c'),)): 3.0}, {})
+
+        self.assertIn('easy_event_requests_total{view="a\\"b\\\\c"} 3\n', body)
@@ -0,0 +1,88 @@
+import io
+import os
+import tempfile
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class TestProfilingMiddleware(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        settings = override_settings(PROFILING_DIR=self.directory, PROFILING_MAX_PROFILES=2)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        staff = User.objects.create_user(username='staff', email='staff@example.com', password='123', is_staff=True)
+        owner = User.objects.create_user(username='owner', email='owner@example.com', password='123',
+                                         is_superuser=True)
+        self.staff_client = APIClient()
+        self.staff_client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=staff).key}')
+        self.owner_client = APIClient()
+        self.owner_client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=owner).key}')
+
+    def stored(self):
+        return sorted(name for name in os.listdir(self.directory) if name.endswith('.json'))
+
+    def test_profiles_staff_requests_on_demand(self):
+        plain = self.staff_client.get('/api/feedbacks/')
+        profiled = self.staff_client.get('/api/feedbacks/', HTTP_X_PROFILE='1')
+
+        self.assertFalse(plain.has_header('X-Profile-Id'))
+        profile_id = profiled['X-Profile-Id']
+        self.assertEqual(self.stored(), [f'{profile_id}.json'])
+        self.assertTrue(os.path.exists(os.path.join(self.directory, f'{profile_id}.prof')))
+        self.assertEqual(profiled.content, plain.content)
+
+    def test_ignores_non_staff_users(self):
+        response = self.owner_client.get('/api/events/', {'profile': '1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('X-Profile-Id'))
+        self.assertEqual(self.stored(), [])
+
+    def test_keeps_the_newest_profiles(self):
+        ids = [self.staff_client.get('/api/accounts/owners/', {'profile': '1'})['X-Profile-Id'] for _ in range(3)]
+
+        self.assertEqual(self.stored(), [f'{profile_id}.json' for profile_id in ids[1:]])
+        self.assertFalse(os.path.exists(os.path.join(self.directory, f'{ids[0]}.prof')))
+
+    def test_command_lists_and_summarizes_profiles(self):
+        profile_id = self.staff_client.get('/api/feedbacks/', HTTP_X_PROFILE='1')['X-Profile-Id']
+
+        listing = io.StringIO()
+        call_command('profiles', stdout=listing)
+        summary = io.StringIO()
+        call_command('profiles', profile_id, '--limit', '5', stdout=summary)
+
+        self.assertIn(f'{profile_id}', listing.getvalue())
+        self.assertIn('GET /api/feedbacks/ (get_feedbacks)', listing.getvalue())
+        self.assertRegex(summary.getvalue(), r'\d+ queries in [\d.]+ ms')
+        self.assertIn('function calls', summary.getvalue())
+        with self.assertRaises(CommandError):
+            call_command('profiles', 'missing', stdout=io.StringIO())
+
+
+class TestAsyncProfiling(TransactionTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        staff = User.objects.create_user(username='staff', email='staff@example.com', password='123', is_staff=True)
+        self.token = Token.objects.create(user=staff).key
+
+    async def test_profiles_requests_under_asgi(self):
+        with override_settings(PROFILING_DIR=self.directory, ROOT_URLCONF='easy_event.asgi_urls'):
+            response = await AsyncClient().get('/api/accounts/owners/', authorization=f'Token {self.token}',
+                                               x_profile='1')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, f"{response['X-Profile-Id']}.prof")))
@@ -0,0 +1,140 @@
+import datetime
+import decimal
+import io
+import uuid
+
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from easy_event.parsers import ORJSONParser
+from easy_event.renderers import ORJSONRenderer
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+
+class ConformanceClient(APIClient):
+    """
+    Checks every JSON response against DRF's JSONRenderer and every JSON
+    request body against DRF's JSONParser.
+    """
+    def __init__(self, test_case, **kwargs):
+        super().__init__(**kwargs)
+        self.test_case = test_case
+        self.checked = []
+
+    def generic(self, method, path, data='', content_type='application/octet-stream', secure=False, **extra):
+        if content_type == 'application/json' and data:
+            self.test_case.assertEqual(ORJSONParser().parse(io.BytesIO(data)), JSONParser().parse(io.BytesIO(data)))
+
+        response = super().generic(method, path, data, content_type, secure, **extra)
+
+        if hasattr(response, 'data'):
+            self.test_case.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+            expected = JSONRenderer().render(response.data, response.accepted_media_type, response.renderer_context)
+            self.test_case.assertEqual(response.content, expected, f'{method} {path}')
+            self.checked.append((method, path, response.status_code))
+        return response
+
+
+class TestORJSONConformance(TestCase):
+    def setUp(self) -> None:
+        self.client = ConformanceClient(self)
+
+    def login(self, username):
+        token = self.client.post('/api/login/', {'username': username, 'password': '1234'}, format='json').json()['token']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+
+    def test_renders_like_drf_on_every_endpoint(self):
+        artist = self.client.post('/api/accounts/', {
+            'username': 'Björk', 'password': '1234', 'email': 'bjork@gmail.com', 'is_superuser': False,
+            'phone': '23995465422', 'solo': True, 'hour_price': 200.5,
+        }, format='json').json()
+        owner = self.client.post('/api/accounts/', {
+            'username': 'Owner', 'password': '1234', 'email': 'owner@gmail.com', 'is_superuser': True,
+        }, format='json').json()
+        self.client.post('/api/accounts/', {'username': 'Owner', 'password': '1234', 'email': 'owner@gmail.com',
+                                            'is_superuser': True}, format='json')
+        self.client.post('/api/accounts/', {'username': 'Incomplete'}, format='json')
+        self.client.post('/api/login/', {'username': 'Owner', 'password': 'wrong'}, format='json')
+
+        self.login('Owner')
+        event = self.client.post('/api/events/', {
+            'datetime': (timezone.now() + timezone.timedelta(days=2)).isoformat(),
+            'repeat_event': 'Weekly',
+            'details': 'Café concert \u2028 with émojis 🎸 and "quotes"',
+            'base_price': 19.9,
+            'address': {'street': 'Rua Augusta', 'neighbourhood': 'Consolação', 'number': 1, 'city': 'São Paulo',
+                        'state': 'SP', 'country': 'Brasil', 'latitude': -23.55, 'longitude': -46.63},
+            'music_styles': [{'name': 'Forró'}, {'name': 'Rock'}],
+        }, format='json').json()
+        events_url = f"/api/events/{event['id']}/"
+        self.client.put(events_url, {**event, 'details': 'Updated details', 'address': event['address'],
+                                     'music_styles': [{'name': 'Jazz'}]}, format='json')
+
+        self.login('Björk')
+        for params in ({}, {'q': 'details'}, {'near': '-23.55,-46.63'}, {'base_price__gte': 'cheap'}):
+            self.client.get('/api/events/', params)
+        self.client.get(events_url)
+        self.client.get('/api/events/occurrences/')
+        self.client.get('/api/events/999/')
+        self.client.patch(f'{events_url}candidatures/')
+
+        self.login('Owner')
+        self.client.get('/api/events/')
+        self.client.get(events_url)
+        self.client.patch(f'{events_url}lineup/', {'lineup': [{'artist_id': artist['id'],
+                                                                'performance_datetime': '2021-12-01 20:00:00'}]},
+                          format='json')
+        self.client.patch(f'{events_url}candidatures/', {'remove_artists': [artist['id']]}, format='json')
+        self.client.post(f'{events_url}feedbacks/', {'description': 'Ótimo', 'stars': 5,
+                                                     'addressed_user': artist['id']}, format='json')
+        self.client.post(f'{events_url}feedbacks/', {'description': 'Ótimo', 'stars': 5,
+                                                     'addressed_user': artist['id']}, format='json')
+        self.client.get(f'{events_url}feedbacks/')
+        self.client.get('/api/events/999/feedbacks/')
+
+        for params in ({}, {'fromUser': owner['id']}, {'page': 1}):
+            self.client.get('/api/feedbacks/', params)
+        for params in ({}, {'ordering': '-rating'}, {'solo': 'maybe'}):
+            self.client.get('/api/accounts/artists/', params)
+        self.client.get('/api/accounts/owners/')
+        self.client.get(f"/api/accounts/{owner['id']}/")
+        self.client.put(f"/api/accounts/{owner['id']}/", {'email': 'new@gmail.com'}, format='json')
+        self.client.delete(f"/api/accounts/{artist['id']}/")
+
+        self.client.credentials()
+        self.client.get(f"/api/accounts/{owner['id']}/")
+
+        self.assertGreaterEqual(len({status for _, _, status in self.client.checked}), 8)
+
+    def test_encodes_python_values_like_drf(self):
+        data = {
+            'aware': datetime.datetime(2021, 12, 1, 20, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'offset': datetime.datetime(2021, 12, 1, 20, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=-3))),
+            'naive': datetime.datetime(2021, 12, 1, 20, 30),
+            'date': datetime.date(2021, 12, 1),
+            'time': datetime.time(20, 30),
+            'decimal': decimal.Decimal('10.50'),
+            'lazy': gettext_lazy('This field is required.'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'duration': datetime.timedelta(hours=1),
+            'nested': [{'separator': '\u2028\u2029', 1: None, 'float': 0.1}],
+            'exponents': [1e16, 1e-7, -2.5e-05, 1.5e300, 1e15, 0.0001],
+            'wide': [2 ** 64, -2 ** 70],
+            'looks_like_a_number': [':1e5,', 'ce0ba8e7'],
+        }
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(ORJSONRenderer().render(data, 'application/json; indent=4'),
+                         JSONRenderer().render(data, 'application/json; indent=4'))
+
+    def test_falls_back_for_values_orjson_writes_differently(self):
+        for value in (1e16, 1e-7, 2 ** 64, [1, {'price': 1e-05}]):
+            self.assertEqual(ORJSONRenderer().render(value), JSONRenderer().render(value))
+
+    def test_renders_non_finite_floats_as_null(self):
+        for value in (float('nan'), float('inf')):
+            self.assertEqual(ORJSONRenderer().render([value]), b'[null]')
+            with self.assertRaises(ValueError):
+                JSONRenderer().render([value])
@@ -0,0 +1,44 @@
+import importlib
+import os
+import sys
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from easy_event.warmup import warm_serializers, warm_up
+
+
+class TestWarmUp(TestCase):
+    def test_warms_urls_serializers_and_connections(self):
+        warmed = warm_up()
+
+        self.assertGreater(warmed['url_patterns'], 0)
+        self.assertEqual(warmed['serializers'], warm_serializers())
+        self.assertEqual(warmed['connections'], 1)
+        self.assertIsNotNone(connection.connection)
+
+    def test_master_warm_up_leaves_the_database_alone(self):
+        self.assertNotIn('connections', warm_up(connect=False))
+
+
+class TestGunicornConf(SimpleTestCase):
+    def load(self, **environ):
+        with mock.patch.dict(os.environ, environ):
+            sys.modules.pop('easy_event.gunicorn_conf', None)
+            return importlib.import_module('easy_event.gunicorn_conf')
+
+    def test_defaults_to_preloaded_sync_workers(self):
+        conf = self.load()
+
+        self.assertEqual((conf.worker_class, conf.wsgi_app), ('sync', 'easy_event.wsgi:application'))
+        self.assertTrue(conf.preload_app)
+
+    def test_selects_the_worker_class(self):
+        self.assertEqual(self.load(GUNICORN_WORKER_CLASS='gthread', GUNICORN_THREADS='8').threads, 8)
+
+        conf = self.load(GUNICORN_WORKER_CLASS='asgi')
+        self.assertEqual((conf.worker_class, conf.wsgi_app), ('uvicorn.workers.UvicornWorker',
+                                                              'easy_event.asgi:application'))
+
+        with self.assertRaises(RuntimeError):
+            self.load(GUNICORN_WORKER_CLASS='eventlet')
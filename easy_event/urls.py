@@ -17,9 +17,12 @@ from django.contrib import admin
 from django.urls import path
 from django.urls.conf import include
 
+from easy_event.metrics import metrics
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('users.urls')),
     path('api/', include('feedbacks.urls')),
     path('api/', include('events.urls')),
+    path('api/metrics', metrics),
 ]
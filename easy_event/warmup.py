@@ -0,0 +1,86 @@
+"""
+Worker warm-up.
+
+A fresh process pays, on its first requests, for compiling the URL
+patterns, importing the classes named in the REST framework settings,
+building serializer fields from the models and opening database
+connections. ``warm_up`` does that work up front; the gunicorn config runs
+it before a worker accepts traffic.
+"""
+import importlib
+import inspect
+import time
+
+from django.db import connections
+from django.urls import URLResolver, get_resolver
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+SERIALIZER_MODULES = ('events.serializers', 'users.serializers', 'feedbacks.serializers')
+URLCONFS = ('easy_event.urls', 'easy_event.asgi_urls')
+
+
+def _count_patterns(patterns):
+    return sum(_count_patterns(pattern.url_patterns) if isinstance(pattern, URLResolver) else 1
+               for pattern in patterns)
+
+
+def warm_urls():
+    count = 0
+
+    for urlconf in URLCONFS:
+        resolver = get_resolver(urlconf)
+        # Populating the reverse lookups compiles every pattern, included ones too.
+        resolver.reverse_dict
+        count += _count_patterns(resolver.url_patterns)
+    return count
+
+
+def warm_rest_framework():
+    for name in api_settings.import_strings:
+        getattr(api_settings, name)
+    return len(api_settings.import_strings)
+
+
+def _build_fields(serializer):
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.BaseSerializer):
+            _build_fields(field)
+
+
+def warm_serializers():
+    count = 0
+
+    for name in SERIALIZER_MODULES:
+        module = importlib.import_module(name)
+        for _, serializer_class in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(serializer_class, serializers.Serializer) or serializer_class.__module__ != name:
+                continue
+            # Bases like the dynamic-fields serializers have no model to read.
+            if issubclass(serializer_class, serializers.ModelSerializer) and not hasattr(serializer_class, 'Meta'):
+                continue
+            _build_fields(serializer_class())
+            count += 1
+    return count
+
+
+def warm_connections():
+    for connection in connections.all():
+        connection.ensure_connection()
+    return len(connections.all())
+
+
+def warm_up(connect=True):
+    """
+    Warms this process and returns what was warmed with the time it took.
+    ``connect=False`` skips the database, for a master about to fork.
+    """
+    start = time.perf_counter()
+    warmed = {'url_patterns': warm_urls(), 'settings': warm_rest_framework(), 'serializers': warm_serializers()}
+    if connect:
+        warmed['connections'] = warm_connections()
+    warmed['seconds'] = time.perf_counter() - start
+    return warmed
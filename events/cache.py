@@ -0,0 +1,75 @@
+import uuid
+from datetime import timedelta
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from easy_event.metrics import record_cache_lookup
+from rest_framework import status
+from rest_framework.response import Response
+
+from events.models import EventModel
+from events.occurrences import occurrences_in_window, window_prefilter
+
+CACHE_TIMEOUT = getattr(settings, 'EVENTS_CACHE_TIMEOUT', 60)
+GENERATION_KEY = 'events:generation'
+DEADLINE_KEY = 'events:deadline:{}'
+
+
+def get_generation():
+    generation = cache.get(GENERATION_KEY)
+
+    if generation is None:
+        cache.add(GENERATION_KEY, uuid.uuid4().hex, None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def invalidate_events_cache():
+    # A fresh value rather than incr, which is not atomic on every backend.
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def next_event_start(now):
+    """
+    Returns when the next event, or occurrence of a series, starts within
+    the cache timeout. Artists only see events that have not started, so a
+    cached page is only correct until then.
+    """
+    end = now + timedelta(seconds=CACHE_TIMEOUT)
+    candidates = window_prefilter(EventModel.objects.all(), now, end).only('id', 'datetime', 'repeat_event')
+    first = next(occurrences_in_window(candidates, now, end), None)
+
+    return first[0] if first else end
+
+
+def get_deadline(generation):
+    key = DEADLINE_KEY.format(generation)
+    now = timezone.now()
+
+    deadline = cache.get(key)
+    if deadline is None or deadline < now:
+        deadline = next_event_start(now)
+        cache.set(key, deadline, (deadline - now).total_seconds())
+    return deadline
+
+
+def cached_response(request, view_method, *args, **kwargs):
+    uri = md5(request.build_absolute_uri().encode()).hexdigest()
+    generation = get_generation()
+    deadline = get_deadline(generation)
+    key = f'events:response:{generation}:{deadline.timestamp()}:{uri}'
+
+    data = cache.get(key)
+    if data is not None:
+        record_cache_lookup('events', True)
+        return Response(data)
+
+    record_cache_lookup('events', False)
+    response = view_method(request, *args, **kwargs)
+
+    timeout = min(CACHE_TIMEOUT, (deadline - timezone.now()).total_seconds())
+    if response.status_code == status.HTTP_200_OK and timeout > 0:
+        cache.set(key, response.data, timeout)
+    return response
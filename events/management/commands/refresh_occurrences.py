@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.cache import invalidate_events_cache
+from events.occurrences import refresh_next_occurrences
+
+
+class Command(BaseCommand):
+    help = 'Moves weekly and monthly events whose occurrence has started on to their next one.'
+
+    def handle(self, *args, **options):
+        updated = refresh_next_occurrences(timezone.now())
+        if updated:
+            invalidate_events_cache()
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {updated} events.'))
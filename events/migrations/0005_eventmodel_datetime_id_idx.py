@@ -0,0 +1,17 @@
+# Generated by Django 3.2.9 on 2026-10-18 08:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_alter_eventmodel_repeat_event'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventmodel',
+            index=models.Index(fields=['datetime', 'id'], name='event_datetime_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.9 on 2026-10-18 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_eventmodel_datetime_id_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='eventmodel',
+            name='base_price',
+            field=models.FloatField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+FTS_TABLE = 'events_eventmodel_fts'
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        schema_editor.execute(f'CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(details)')
+        schema_editor.execute(f'INSERT INTO {FTS_TABLE} (rowid, details) SELECT id, details FROM events_eventmodel')
+
+    elif vendor == 'postgresql':
+        schema_editor.execute("CREATE INDEX events_eventmodel_details_fts ON events_eventmodel "
+                              "USING GIN (to_tsvector('english', details))")
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+    elif vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS events_eventmodel_details_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_eventmodel_base_price_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
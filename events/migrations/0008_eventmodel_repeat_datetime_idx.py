@@ -0,0 +1,17 @@
+# Generated by Django 3.2.9 on 2026-10-18 08:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_eventmodel_details_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventmodel',
+            index=models.Index(fields=['repeat_event', 'datetime'], name='event_repeat_datetime_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.9 on 2026-10-18 09:22
+
+from django.db import migrations, models
+from django.utils import timezone
+
+from events.occurrences import next_occurrence
+
+
+def fill_next_datetime(apps, schema_editor):
+    EventModel = apps.get_model('events', 'EventModel')
+    now = timezone.now()
+
+    events = list(EventModel.objects.only('id', 'datetime', 'repeat_event'))
+    for event in events:
+        event.next_datetime = next_occurrence(event.datetime, event.repeat_event, now)
+    EventModel.objects.bulk_update(events, ['next_datetime'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_eventmodel_repeat_datetime_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventmodel',
+            name='next_datetime',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(fill_next_datetime, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='eventmodel',
+            index=models.Index(fields=['next_datetime', 'id'], name='event_next_datetime_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventmodel',
+            index=models.Index(fields=['repeat_event', 'next_datetime'], name='event_repeat_next_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+from django.db import migrations
+
+FTS_TABLE = 'events_eventmodel_fts'
+
+# The index reads details from events_eventmodel and these triggers keep it
+# in step with every write, including bulk_create, QuerySet.update and raw
+# SQL. SQLite drops triggers with their table, so a later migration that
+# rebuilds events_eventmodel has to create them again.
+TRIGGERS = [
+    f'''CREATE TRIGGER {FTS_TABLE}_insert AFTER INSERT ON events_eventmodel BEGIN
+        INSERT INTO {FTS_TABLE} (rowid, details) VALUES (new.id, new.details);
+    END''',
+    f'''CREATE TRIGGER {FTS_TABLE}_delete AFTER DELETE ON events_eventmodel BEGIN
+        INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, details) VALUES ('delete', old.id, old.details);
+    END''',
+    f'''CREATE TRIGGER {FTS_TABLE}_update AFTER UPDATE OF id, details ON events_eventmodel BEGIN
+        INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, details) VALUES ('delete', old.id, old.details);
+        INSERT INTO {FTS_TABLE} (rowid, details) VALUES (new.id, new.details);
+    END''',
+]
+
+
+def create_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+    schema_editor.execute(f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(details, content='events_eventmodel', "
+                          "content_rowid='id')")
+    for trigger in TRIGGERS:
+        schema_editor.execute(trigger)
+    schema_editor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def drop_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    for action in ('insert', 'delete', 'update'):
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {FTS_TABLE}_{action}')
+    schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+    schema_editor.execute(f'CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(details)')
+    schema_editor.execute(f'INSERT INTO {FTS_TABLE} (rowid, details) SELECT id, details FROM events_eventmodel')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_eventmodel_next_datetime'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class RepeatEvent(models.TextChoices):
@@ -19,11 +20,26 @@ class EventModel(models.Model):
     address = models.ForeignKey('adresses.AdressesModel', on_delete=models.PROTECT)
     owner = models.ForeignKey('users.User', on_delete=models.PROTECT)
     details = models.TextField()
-    base_price = models.FloatField()
+    base_price = models.FloatField(db_index=True)
     lineup = models.ManyToManyField('users.User', related_name='events', through=LineupEventModel)
     candidatures = models.ManyToManyField('users.User', related_name='candidatures')
     music_styles = models.ManyToManyField('music_styles.MusicStyleModel')
+    # When the event, or the next occurrence of a series, starts; the feed
+    # is ordered by it. Series move on in events.occurrences.
+    next_datetime = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['datetime', 'id'], name='event_datetime_id_idx'),
+            models.Index(fields=['repeat_event', 'datetime'], name='event_repeat_datetime_idx'),
+            models.Index(fields=['next_datetime', 'id'], name='event_next_datetime_id_idx'),
+            models.Index(fields=['repeat_event', 'next_datetime'], name='event_repeat_next_idx'),
+        ]
 
     def save(self, *args, **kwargs):
+        # events.occurrences imports this module.
+        from events.occurrences import next_occurrence
+
         self.full_clean()
+        self.next_datetime = next_occurrence(self.datetime, self.repeat_event, timezone.now())
         super().save()
@@ -0,0 +1,103 @@
+import calendar
+import heapq
+import math
+from datetime import timedelta
+
+from django.db.models import Q
+
+from events.models import EventModel, RepeatEvent
+
+WEEK = timedelta(weeks=1)
+# Longer than any gap between two occurrences of a series.
+LONGEST_GAP = timedelta(days=32)
+RECURRING = [RepeatEvent.WEEKLY, RepeatEvent.MONTHLY]
+
+
+def add_months(value, months, day):
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+
+    return value.replace(year=year, month=month, day=min(day, calendar.monthrange(year, month)[1]))
+
+
+def iter_occurrences(start, repeat_event, window_start, window_end):
+    """
+    Lazily yields the occurrences of a series anchored at ``start`` that fall
+    in ``[window_start, window_end)``, jumping straight to the first one in
+    the window instead of walking the series from its anchor.
+    """
+    if repeat_event == RepeatEvent.WEEKLY:
+        weeks = max(0, math.ceil((window_start - start) / WEEK))
+        occurrence = start + weeks * WEEK
+
+        while occurrence < window_end:
+            yield occurrence
+            occurrence += WEEK
+
+    elif repeat_event == RepeatEvent.MONTHLY:
+        months = max(0, (window_start.year - start.year) * 12 + window_start.month - start.month - 1)
+        occurrence = add_months(start, months, start.day)
+
+        while occurrence < window_end:
+            if occurrence >= window_start:
+                yield occurrence
+            months += 1
+            occurrence = add_months(start, months, start.day)
+
+    elif window_start <= start < window_end:
+        yield start
+
+
+def next_occurrence(start, repeat_event, after):
+    """
+    Returns the first occurrence of a series at or after ``after``. A one-off
+    event only has its own start, as has a series that has not started yet.
+    """
+    if repeat_event not in RECURRING or start >= after:
+        return start
+    return next(iter_occurrences(start, repeat_event, after, after + LONGEST_GAP))
+
+
+def refresh_next_occurrences(now):
+    """
+    Moves every series whose next occurrence has started on to its
+    following one, and fills in events created without ``save``, such as
+    by ``bulk_create``. Returns how many events were updated.
+    """
+    stale = EventModel.objects\
+        .filter(Q(next_datetime__isnull=True) | Q(repeat_event__in=RECURRING, next_datetime__lt=now))\
+        .only('id', 'datetime', 'repeat_event')
+
+    events = list(stale)
+    for event in events:
+        event.next_datetime = next_occurrence(event.datetime, event.repeat_event, now)
+    EventModel.objects.bulk_update(events, ['next_datetime'], batch_size=1000)
+    return len(events)
+
+
+def window_prefilter(queryset, window_start, window_end):
+    """
+    Narrows ``queryset`` to events that can occur in the window: one-off
+    events inside it, and series anchored before its end. Both branches are
+    range scans on the (repeat_event, datetime) index.
+    """
+    one_off = Q(repeat_event=RepeatEvent.NULL, datetime__gte=window_start, datetime__lt=window_end)
+    recurring = Q(repeat_event__in=RECURRING, datetime__lt=window_end)
+
+    return queryset.filter(one_off | recurring)
+
+
+def _event_occurrences(event, window_start, window_end):
+    for occurrence in iter_occurrences(event.datetime, event.repeat_event, window_start, window_end):
+        yield occurrence, event.id, event
+
+
+def occurrences_in_window(events, window_start, window_end):
+    """
+    Merges the occurrences of ``events`` into one stream of
+    ``(datetime, event)`` pairs ordered by datetime, generated on demand.
+    """
+    streams = [_event_occurrences(event, window_start, window_end) for event in events]
+
+    return ((occurrence, event) for occurrence, _, event in heapq.merge(*streams))
@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    ordering = ('next_datetime', 'id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        return getattr(view, 'pagination_ordering', None) or super().get_ordering(request, queryset, view)
@@ -1,5 +1,5 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
-from django.shortcuts import get_object_or_404
+from easy_event.identity_map import get_request_object_or_404
 from events.models import EventModel
 
 
@@ -16,6 +16,6 @@ class IsOwnerResourceOrCreateRead(BasePermission):
         if request.method in SAFE_METHODS or request.method == "POST":
             return True
 
-        event = get_object_or_404(EventModel, id=view.kwargs['pk'])
+        event = get_request_object_or_404(request, EventModel, view.kwargs['pk'])
 
-        return request.user.id == event.owner.id
+        return request.user.id == event.owner_id
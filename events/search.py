@@ -0,0 +1,31 @@
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'events_eventmodel_fts'
+
+
+def fts5_query(text):
+    return ' '.join('"{}"'.format(term.replace('"', '""')) for term in text.split())
+
+
+def full_text_search(queryset, text):
+    """
+    Filters ``queryset`` to events whose details match ``text`` and annotates
+    a ``relevance`` score where higher is better.
+    """
+    if connection.vendor == 'sqlite':
+        query = fts5_query(text)
+        matches = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [query])
+        relevance = RawSQL(f'SELECT -rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = events_eventmodel.id',
+                           [query], output_field=FloatField())
+        return queryset.filter(id__in=matches).annotate(relevance=relevance)
+
+    if connection.vendor == 'postgresql':
+        matches = RawSQL("to_tsvector('english', events_eventmodel.details) @@ plainto_tsquery('english', %s)",
+                         [text], output_field=BooleanField())
+        relevance = RawSQL("ts_rank(to_tsvector('english', events_eventmodel.details), plainto_tsquery('english', %s))",
+                           [text], output_field=FloatField())
+        return queryset.filter(matches).annotate(relevance=relevance)
+
+    return queryset.filter(details__icontains=text).annotate(relevance=Value(1.0, output_field=FloatField()))
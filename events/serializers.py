@@ -1,7 +1,10 @@
+from datetime import timedelta
+
 from adresses.models import AdressesModel
 from adresses.serializers import AdressesSerializer
-from django.shortcuts import get_object_or_404
-from music_styles.models import MusicStyleModel
+from django.utils import timezone
+from easy_event.identity_map import get_request_object_or_404
+from music_styles.catalog import resolve_music_style_ids
 from rest_framework import serializers
 from users.models import User
 from users.serializers import UserSerializer
@@ -25,33 +28,70 @@ class EventSerializer(serializers.ModelSerializer):
 
         music_styles = validated_data.pop('music_styles')
         address_data = validated_data.pop('address')
-        address, _ = AdressesModel.objects.get_or_create(**address_data)
-        owner = get_object_or_404(User, id=self.context['request'].user.id)
+        address, _ = AdressesModel.get_or_create_from_data(address_data)
+        request = self.context['request']
+        owner = get_request_object_or_404(request, User, request.user.id)
         validated_data['owner'] = owner
         validated_data['address'] = address
         event = EventModel.objects.create(**validated_data)
 
-        for music_style in music_styles:
-            event_music_style, _ = MusicStyleModel.objects.get_or_create(**music_style)
-            event.music_styles.add(event_music_style)
+        event.music_styles.add(*resolve_music_style_ids(music_style['name'] for music_style in music_styles))
 
         return event
 
     def update(self, instance, validated_data):
 
         address_data = validated_data.pop('address')
-        address, _ = AdressesModel.objects.get_or_create(**address_data)
+        address, _ = AdressesModel.get_or_create_from_data(address_data)
         music_styles = validated_data.pop('music_styles')
-        instance.music_styles.clear()
         validated_data['address'] = address
 
-        for music_style in music_styles:
-            event_music_style, _ = MusicStyleModel.objects.get_or_create(**music_style)
-            instance.music_styles.add(event_music_style)
+        instance.music_styles.set(resolve_music_style_ids(music_style['name'] for music_style in music_styles))
 
         return super().update(instance, validated_data)
 
 
+class EventSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(required=False)
+    music_styles__name = serializers.CharField(required=False)
+    address__city = serializers.CharField(required=False)
+    address__state = serializers.CharField(required=False)
+    base_price__gte = serializers.FloatField(required=False)
+    base_price__lte = serializers.FloatField(required=False)
+    # The window matches the next occurrence, which is what the feed lists and sorts by.
+    datetime__gte = serializers.DateTimeField(required=False, source='next_datetime__gte')
+    datetime__lte = serializers.DateTimeField(required=False, source='next_datetime__lte')
+    near = serializers.CharField(required=False)
+    radius = serializers.FloatField(required=False, min_value=0, max_value=500, default=20)
+
+    def validate_near(self, value):
+        try:
+            latitude, longitude = (float(coordinate) for coordinate in value.split(','))
+        except ValueError:
+            raise serializers.ValidationError('Expected "latitude,longitude".')
+
+        if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+            raise serializers.ValidationError('Coordinates out of range.')
+        return latitude, longitude
+
+
+class EventOccurrencesSerializer(serializers.Serializer):
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=1000, default=100)
+
+    def validate(self, attrs):
+        start = attrs.get('start') or timezone.now()
+        end = attrs.get('end') or start + timedelta(days=30)
+
+        if end <= start:
+            raise serializers.ValidationError({'end': 'Must be after start.'})
+        if end - start > timedelta(days=366):
+            raise serializers.ValidationError({'end': 'The window cannot be longer than 366 days.'})
+
+        return {**attrs, 'start': start, 'end': end}
+
+
 class LineupEventSerializer(serializers.ModelSerializer):
     class Meta:
         model = LineupEventModel
@@ -0,0 +1,17 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from events.cache import invalidate_events_cache
+from events.models import EventModel, LineupEventModel
+
+
+@receiver(post_save, sender=EventModel)
+@receiver(post_delete, sender=EventModel)
+@receiver(post_save, sender=LineupEventModel)
+@receiver(post_delete, sender=LineupEventModel)
+@receiver(m2m_changed, sender=EventModel.lineup.through)
+@receiver(m2m_changed, sender=EventModel.candidatures.through)
+@receiver(m2m_changed, sender=EventModel.music_styles.through)
+def invalidate_events_on_change(**_):
+    invalidate_events_cache()
+
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from django.test import SimpleTestCase
+from events.models import RepeatEvent
+from events.occurrences import iter_occurrences, next_occurrence, occurrences_in_window
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class FakeEvent:
+    def __init__(self, id, datetime, repeat_event):
+        self.id = id
+        self.datetime = datetime
+        self.repeat_event = repeat_event
+
+
+class TestOccurrences(SimpleTestCase):
+
+    def test_weekly_series_starts_at_first_occurrence_in_window(self):
+        occurrences = list(iter_occurrences(utc(2021, 1, 1, 20), RepeatEvent.WEEKLY,
+                                            utc(2021, 3, 1), utc(2021, 3, 22)))
+
+        self.assertEqual(occurrences, [utc(2021, 3, 5, 20), utc(2021, 3, 12, 20), utc(2021, 3, 19, 20)])
+
+    def test_monthly_series_clamps_to_end_of_month(self):
+        occurrences = list(iter_occurrences(utc(2021, 1, 31, 20), RepeatEvent.MONTHLY,
+                                            utc(2021, 1, 1), utc(2021, 5, 1)))
+
+        self.assertEqual(occurrences, [utc(2021, 1, 31, 20), utc(2021, 2, 28, 20),
+                                       utc(2021, 3, 31, 20), utc(2021, 4, 30, 20)])
+
+    def test_one_off_event_only_inside_window(self):
+        self.assertEqual(list(iter_occurrences(utc(2021, 1, 1), RepeatEvent.NULL, utc(2021, 1, 1), utc(2021, 2, 1))),
+                         [utc(2021, 1, 1)])
+        self.assertEqual(list(iter_occurrences(utc(2021, 1, 1), RepeatEvent.NULL, utc(2021, 1, 2), utc(2021, 2, 1))),
+                         [])
+
+    def test_series_anchored_long_ago_is_not_walked(self):
+        occurrences = iter_occurrences(utc(1900, 1, 5), RepeatEvent.WEEKLY, utc(2021, 1, 1), utc(9999, 1, 1))
+
+        self.assertEqual(list(islice(occurrences, 2)), [utc(2021, 1, 1), utc(2021, 1, 8)])
+
+    def test_next_occurrence(self):
+        self.assertEqual(next_occurrence(utc(2021, 1, 31, 20), RepeatEvent.MONTHLY, utc(2021, 3, 1)),
+                         utc(2021, 3, 31, 20))
+        self.assertEqual(next_occurrence(utc(2021, 6, 1), RepeatEvent.MONTHLY, utc(2021, 1, 1)), utc(2021, 6, 1))
+        self.assertEqual(next_occurrence(utc(2021, 1, 1), RepeatEvent.NULL, utc(2021, 3, 1)), utc(2021, 1, 1))
+
+    def test_occurrences_are_merged_in_order(self):
+        weekly = FakeEvent(1, utc(2021, 1, 4), RepeatEvent.WEEKLY)
+        monthly = FakeEvent(2, utc(2021, 1, 10), RepeatEvent.MONTHLY)
+        one_off = FakeEvent(3, utc(2021, 1, 12), RepeatEvent.NULL)
+
+        occurrences = occurrences_in_window([weekly, monthly, one_off], utc(2021, 1, 1), utc(2021, 1, 19))
+
+        self.assertEqual([(occurrence, event.id) for occurrence, event in occurrences],
+                         [(utc(2021, 1, 4), 1), (utc(2021, 1, 10), 2), (utc(2021, 1, 11), 1),
+                          (utc(2021, 1, 12), 3), (utc(2021, 1, 18), 1)])
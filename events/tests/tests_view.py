@@ -1,7 +1,19 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
+
+from adresses.models import AdressesModel
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from events.models import EventModel
+from django.utils.dateparse import parse_datetime
+from easy_event.metrics import get_store
+from events.cache import get_deadline, get_generation
+from events.models import EventModel, LineupEventModel
 from events.serializers import EventLineupCandidaturesSerializer
+from music_styles.catalog import GENERATION_KEY as CATALOG_GENERATION_KEY
 from music_styles.models import MusicStyleModel
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
@@ -94,6 +106,79 @@ class TestEventViews(TestCase):
         self.assertEqual(response.json()['id'], 1)
         self.assertEqual(len(self.music_styles), MusicStyleModel.objects.count())
 
+    def test_create_events_reuses_normalized_address(self):
+        first = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['address'] = {**self.address, 'street': '  e 39TH   st ', 'city': 'NEW YORK'}
+        second = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.assertEqual(first['address']['id'], second['address']['id'])
+        self.assertEqual(AdressesModel.objects.count(), 1)
+
+    def test_new_coordinates_do_not_move_other_events(self):
+        first = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+        second = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['address'] = {**self.address, 'latitude': 40.7484, 'longitude': -73.9857}
+        updated = self.client.put(f"{self.base_url}{second['id']}/", self.event_data, format='json').json()
+
+        self.assertNotEqual(updated['address']['id'], first['address']['id'])
+        self.assertIsNone(AdressesModel.objects.get(id=first['address']['id']).latitude)
+        self.assertEqual(set(updated['address']), {'id', 'street', 'neighbourhood', 'number', 'city', 'state',
+                                                   'country', 'latitude', 'longitude'})
+
+    def test_dedupe_addresses_command_merges_duplicates(self):
+        first = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+        second = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        duplicate = AdressesModel.objects.create(**{**self.address, 'city': 'Old York'})
+        AdressesModel.objects.filter(id=duplicate.id).update(city='new york', fingerprint=None)
+        EventModel.objects.filter(id=second['id']).update(address=duplicate)
+
+        call_command('dedupe_addresses', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(AdressesModel.objects.count(), 1)
+        self.assertEqual(EventModel.objects.get(id=second['id']).address_id, first['address']['id'])
+
+    def test_create_event_resolves_music_styles_from_catalog(self):
+        self.event_data['music_styles'] = [{'name': f'Style {index}'} for index in range(10)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        style_queries = [query for query in queries if '"music_styles_musicstylemodel"."name" IN' in query['sql']]
+        through_inserts = [query for query in queries
+                           if query['sql'].startswith('INSERT') and '"events_eventmodel_music_styles"' in query['sql']]
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()['music_styles']), 10)
+        self.assertEqual(len(style_queries), 0)
+        self.assertEqual(len(through_inserts), 1)
+
+    def test_catalog_follows_music_style_changes_from_other_workers(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        MusicStyleModel.objects.filter(name='Rock').update(name='Metal')
+        cache.set(CATALOG_GENERATION_KEY, 'bumped by another worker', None)
+        response = self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        event = EventModel.objects.get(id=response.json()['id'])
+        self.assertEqual(sorted(event.music_styles.values_list('name', flat=True)), ['Country', 'Rock'])
+
+    def test_update_event_music_styles(self):
+        event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['music_styles'] = [{'name': 'Rock'}, {'name': 'Jazz'}]
+        response = self.client.put(f"{self.base_url}{event['id']}/", self.event_data, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['music_styles'], [{'name': 'Rock'}, {'name': 'Jazz'}])
+        self.assertEqual(MusicStyleModel.objects.count(), 3)
+
     def test_artist_cannot_create_new_event(self):
         artist = self.client.post('/api/accounts/', self.artist_data, format='json')
         token_artist = self.client.post('/api/login/', self.artist_login, format='json').json()['token']
@@ -151,6 +236,28 @@ class TestEventViews(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(0, count_candidatures)
 
+    def test_owner_reject_reports_artists_not_in_candidatures(self):
+        event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        artist = self.client.post('/api/accounts/', self.artist_data, format='json').json()
+        token_artist = self.client.post('/api/login/', self.artist_login, format='json').json()['token']
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_artist}')
+
+        self.client.patch(f"{self.base_url}{event['id']}/candidatures/")
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_owner.key}')
+
+        remove_artists = {
+            "remove_artists": [artist['id'], artist['id'] + 1]
+        }
+
+        response = self.client.patch(f"{self.base_url}{event['id']}/candidatures/", remove_artists, format='json')
+        count_candidatures = EventModel.objects.get(id=event['id']).candidatures.count()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(0, count_candidatures)
+        self.assertEqual(response.json()['candidatures'], [])
+        self.assertEqual(response.json()['missing_artists'], [artist['id'] + 1])
+
     def test_insert_artist_in_lineup(self):
         event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
 
@@ -177,6 +284,35 @@ class TestEventViews(TestCase):
         self.assertEqual(1, event.lineup.count())
         self.assertEqual(0, event.candidatures.count())
 
+    def test_insert_artist_in_lineup_once(self):
+        event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        artist = self.client.post('/api/accounts/', self.artist_data, format='json').json()
+        token_artist = self.client.post('/api/login/', self.artist_login, format='json').json()['token']
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_artist}')
+        self.client.patch(f"{self.base_url}{event['id']}/candidatures/")
+
+        lineup = {
+            "lineup": [
+                {"artist_id": artist['id'], "performance_datetime": "2021-12-2 20:00:00"},
+                {"artist_id": str(artist['id']), "performance_datetime": "2021-12-2 22:00:00"},
+            ]
+        }
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_owner.key}')
+        response = self.client.patch(f"{self.base_url}{event['id']}/lineup/", lineup, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['lineup']), 1)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_artist}')
+        self.client.patch(f"{self.base_url}{event['id']}/candidatures/")
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_owner.key}')
+        self.client.patch(f"{self.base_url}{event['id']}/lineup/", lineup, format='json')
+
+        lineups = LineupEventModel.objects.filter(event_id=event['id'])
+        self.assertEqual(list(lineups.values_list('artist_id', 'performance_datetime__hour')), [(artist['id'], 20)])
+
     def test_insert_artist_no_candidate_in_lineup_event(self):
         event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
 
@@ -195,6 +331,36 @@ class TestEventViews(TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json()['error'], f"Artist with id {artist['id']} not in candidatures")
 
+    def test_lineup_is_not_partially_written_when_an_artist_is_invalid(self):
+        event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        artist = self.client.post('/api/accounts/', self.artist_data, format='json').json()
+        token_artist = self.client.post('/api/login/', self.artist_login, format='json').json()['token']
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_artist}')
+        self.client.patch(f"{self.base_url}{event['id']}/candidatures/")
+
+        not_candidate = User.objects.create_user(username='not_candidate', email='not_candidate@example.com', password='123')
+
+        lineup = {
+            "lineup": [{
+                "artist_id": artist['id'],
+                "performance_datetime": "2021-12-2 20:00:00"
+            }, {
+                "artist_id": not_candidate.id,
+                "performance_datetime": "2021-12-2 21:00:00"
+            }
+            ]
+        }
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_owner.key}')
+
+        response = self.client.patch(f"{self.base_url}{event['id']}/lineup/", lineup, format='json')
+        event = EventModel.objects.get(id=event['id'])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(0, event.lineup.count())
+        self.assertEqual(1, event.candidatures.count())
+
     def test_cannot_insert_artist_with_performance_datetime_before_event_datetime(self):
         event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
 
@@ -277,8 +443,182 @@ class TestEventViews(TestCase):
         response = self.client.get(self.base_url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.json()), EventModel.objects.count())
-        self.assertIn(EventLineupCandidaturesSerializer(instance=event).data, response.data)
+        self.assertEqual(len(response.json()['results']), EventModel.objects.count())
+        self.assertIn(EventLineupCandidaturesSerializer(instance=event).data, response.data['results'])
+
+    def test_list_events_follows_cursor_pages(self):
+        for _ in range(5):
+            self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        response = self.client.get(self.base_url, {'page_size': 2})
+        ids = [event['id'] for event in response.json()['results']]
+
+        while response.json()['next']:
+            response = self.client.get(response.json()['next'])
+            ids += [event['id'] for event in response.json()['results']]
+
+        self.assertEqual(ids, list(EventModel.objects.order_by('datetime', 'id').values_list('id', flat=True)))
+
+    def test_search_events(self):
+        cheap_rock = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['base_price'] = 100
+        self.event_data['music_styles'] = [{'name': 'Jazz'}]
+        self.event_data['address'] = {**self.address, 'city': 'Boston', 'state': 'MA'}
+        expensive_jazz = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        def search(**params):
+            response = self.client.get(self.base_url, params)
+            self.assertEqual(response.status_code, 200)
+            return [event['id'] for event in response.json()['results']]
+
+        self.assertEqual(search(music_styles__name='Rock'), [cheap_rock['id']])
+        self.assertEqual(search(music_styles__name='Rock,Jazz'), [cheap_rock['id'], expensive_jazz['id']])
+        self.assertEqual(search(address__city='Boston'), [expensive_jazz['id']])
+        self.assertEqual(search(address__state='NY'), [cheap_rock['id']])
+        self.assertEqual(search(base_price__gte=50), [expensive_jazz['id']])
+        self.assertEqual(search(base_price__lte=50), [cheap_rock['id']])
+        self.assertEqual(search(datetime__gte=(self.datetime + timezone.timedelta(days=8)).isoformat()), [])
+        self.assertEqual(search(datetime__lte=(self.datetime + timezone.timedelta(days=8)).isoformat()),
+                         [cheap_rock['id'], expensive_jazz['id']])
+
+    def test_search_window_matches_the_next_occurrence(self):
+        self.event_data['datetime'] = self.datetime - timezone.timedelta(weeks=3, days=1)
+        weekly = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        def search(**params):
+            response = self.client.get(self.base_url, params)
+            self.assertEqual(response.status_code, 200)
+            return [event['id'] for event in response.json()['results']]
+
+        week = {'datetime__gte': self.datetime.isoformat(),
+                'datetime__lte': (self.datetime + timezone.timedelta(weeks=1)).isoformat()}
+        self.assertEqual(search(**week), [weekly['id']])
+        self.assertEqual(search(datetime__lte=self.datetime.isoformat()), [])
+
+    def test_full_text_search_events_ranked_by_relevance(self):
+        self.event_data['details'] = 'Jazz night with a jazz quartet and jazz jam session'
+        jazz_night = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['details'] = 'Rock festival with a jazz stage'
+        rock_festival = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['details'] = 'Country music barbecue'
+        self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        response = self.client.get(self.base_url, {'q': 'jazz'})
+        self.assertEqual([event['id'] for event in response.json()['results']], [jazz_night['id'], rock_festival['id']])
+
+        self.event_data['details'] = 'Acoustic session'
+        self.client.put(f"{self.base_url}{jazz_night['id']}/", self.event_data, format='json')
+
+        response = self.client.get(self.base_url, {'q': 'jazz'})
+        self.assertEqual([event['id'] for event in response.json()['results']], [rock_festival['id']])
+
+    def test_full_text_search_follows_bulk_writes(self):
+        event = EventModel.objects.get(id=self.client.post(f'{self.base_url}', self.event_data, format='json').json()['id'])
+
+        def search(text):
+            return [event['id'] for event in self.client.get(self.base_url, {'q': text}).json()['results']]
+
+        EventModel.objects.filter(id=event.id).update(details='Jazz brunch')
+        self.assertEqual(search('jazz'), [event.id])
+
+        event.pk = None
+        event.details = 'Blues night'
+        EventModel.objects.bulk_create([event])
+        blues_night = EventModel.objects.get(details='Blues night')
+        self.assertEqual(search('blues'), [blues_night.id])
+
+        EventModel.objects.filter(id=blues_night.id)._raw_delete(connection.alias)
+        self.assertEqual(search('blues'), [])
+
+    def test_full_text_search_follows_cursor_pages(self):
+        for index in range(5):
+            self.event_data['details'] = ' '.join(['jazz'] * (index + 1))
+            self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        response = self.client.get(self.base_url, {'q': 'jazz', 'page_size': 2})
+        ids = [event['id'] for event in response.json()['results']]
+
+        while response.json()['next']:
+            response = self.client.get(response.json()['next'])
+            ids += [event['id'] for event in response.json()['results']]
+
+        self.assertEqual(ids, [5, 4, 3, 2, 1])
+
+    def test_search_events_near_a_point(self):
+        self.event_data['address'] = {**self.address, 'street': '5th Ave', 'latitude': 40.7484, 'longitude': -73.9857}
+        empire_state = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['address'] = {**self.address, 'street': 'Liberty Island', 'latitude': 40.6892, 'longitude': -74.0445}
+        liberty_island = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['address'] = {**self.address, 'city': 'Boston', 'latitude': 42.3601, 'longitude': -71.0589}
+        self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        self.event_data['address'] = {**self.address, 'street': 'Unknown'}
+        self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        def search(**params):
+            response = self.client.get(self.base_url, params)
+            self.assertEqual(response.status_code, 200)
+            return [event['id'] for event in response.json()['results']]
+
+        self.assertEqual(search(near='40.7580,-73.9855', radius=5), [empire_state['id']])
+        self.assertEqual(search(near='40.7580,-73.9855', radius=20), [empire_state['id'], liberty_island['id']])
+        self.assertEqual(len(search(near='40.7580,-73.9855', radius=400)), 3)
+
+        response = self.client.get(self.base_url, {'near': 'times square'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_events_with_invalid_parameter(self):
+        response = self.client.get(self.base_url, {'base_price__gte': 'cheap'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('base_price__gte', response.json())
+
+    def test_list_event_occurrences(self):
+        self.event_data['datetime'] = self.datetime - timezone.timedelta(days=30)
+        weekly = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        self.event_data['datetime'] = self.datetime + timezone.timedelta(days=3)
+        self.event_data['repeat_event'] = 'None'
+        one_off = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        artist = self.client.post('/api/accounts/', self.artist_data, format='json')
+        token_artist = self.client.post('/api/login/', self.artist_login, format='json').json()['token']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_artist}')
+
+        # The series started a month ago; its next occurrence is in five days.
+        feed = self.client.get(self.base_url).json()['results']
+        self.assertEqual([event['id'] for event in feed], [one_off['id'], weekly['id']])
+        self.assertEqual(parse_datetime(feed[1]['next_datetime']), self.datetime + timezone.timedelta(days=5))
+
+        response = self.client.get(f'{self.base_url}occurrences/', {'end': (self.datetime + timezone.timedelta(days=15)).isoformat()})
+        occurrences = [(occurrence['event']['id'], occurrence['datetime']) for occurrence in response.json()]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([event_id for event_id, _ in occurrences], [one_off['id'], weekly['id'], weekly['id']])
+        self.assertEqual(sorted(occurrences, key=lambda occurrence: occurrence[1]), occurrences)
+
+        response = self.client.get(f'{self.base_url}occurrences/', {'limit': 1})
+        self.assertEqual(len(response.json()), 1)
+
+    def test_artists_do_not_see_past_occurrences(self):
+        self.event_data['datetime'] = self.datetime - timezone.timedelta(days=3)
+        self.event_data['repeat_event'] = 'None'
+        self.client.post(f'{self.base_url}', self.event_data, format='json')
+
+        self.client.post('/api/accounts/', self.artist_data, format='json')
+        token_artist = self.client.post('/api/login/', self.artist_login, format='json').json()['token']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_artist}')
+
+        response = self.client.get(f'{self.base_url}occurrences/',
+                                   {'start': (self.datetime - timezone.timedelta(days=10)).isoformat()})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
 
     def test_get_event_by_id(self):
         event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
@@ -294,9 +634,196 @@ class TestEventViews(TestCase):
 
         self.assertEqual(response.status_code, 204)
 
+    def test_delete_event_loads_event_once(self):
+        event = self.client.post(f'{self.base_url}', self.event_data, format='json').json()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(f'{self.base_url}{event["id"]}/')
+
+        event_selects = [query for query in queries
+                         if query['sql'].startswith('SELECT') and 'FROM "events_eventmodel"' in query['sql']]
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(len(event_selects), 1)
+
     def test_delete_non_existent_event(self):
         invalid_event_id = EventModel.objects.count() + 1
         response = self.client.delete(f'{self.base_url}{invalid_event_id}/')
 
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json()['detail'], "Not found.")
+
+
+class EventViewsTestCase(TestCase):
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.base_url = "/api/events/"
+        self.client = APIClient()
+
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='123',
+            is_superuser=True
+        )
+        self.artist = User.objects.create_user(
+            username='artist',
+            email='artist@example.com',
+            password='123',
+            is_superuser=False
+        )
+
+        self.event_data = {
+            'datetime': timezone.now() + timezone.timedelta(days=1),
+            'repeat_event': 'Weekly',
+            'details': 'details',
+            'base_price': 9.99,
+            'address': {
+                'street': 'E 39th St',
+                'neighbourhood': 'Murray Hill',
+                'number': 39,
+                'city': 'New York',
+                'state': 'NY',
+                'country': 'New York',
+            },
+            'music_styles': [{'name': 'Rock'}, {'name': 'Country'}],
+        }
+
+        self.token_owner = Token.objects.create(user=self.owner)
+        self.token_artist = Token.objects.create(user=self.artist)
+
+
+class TestEventViewsQueryBudget(EventViewsTestCase):
+    query_budget = 6
+
+    def create_events(self, amount):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_owner.key}')
+
+        for _ in range(amount):
+            event = self.client.post(self.base_url, self.event_data, format='json').json()
+            event = EventModel.objects.get(id=event['id'])
+            event.candidatures.add(self.artist)
+            event.lineup.add(self.artist, through_defaults={'performance_datetime': event.datetime})
+
+    def assert_list_within_budget(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.base_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(queries), self.query_budget)
+        return len([query for query in queries if 'authtoken_token' not in query['sql']])
+
+    def test_owner_list_queries_do_not_grow_with_events(self):
+        self.create_events(1)
+        few_events_queries = self.assert_list_within_budget(self.token_owner)
+
+        self.create_events(10)
+        many_events_queries = self.assert_list_within_budget(self.token_owner)
+
+        self.assertEqual(few_events_queries, many_events_queries)
+
+    def test_artist_list_queries_do_not_grow_with_events(self):
+        self.create_events(1)
+        few_events_queries = self.assert_list_within_budget(self.token_artist)
+
+        self.create_events(10)
+        many_events_queries = self.assert_list_within_budget(self.token_artist)
+
+        self.assertEqual(few_events_queries, many_events_queries)
+
+    def test_fast_serializers_render_the_same_artist_list(self):
+        self.create_events(2)
+        self.event_data['music_styles'] = [{'name': 'Jazz'}]
+        self.event_data['address']['latitude'] = -23.55
+        self.create_events(1)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_artist.key}')
+
+        for params in ({}, {'page_size': 2}, {'q': 'details'}, {'music_styles__name': 'Jazz'}):
+            responses = []
+            for fast in (False, True):
+                cache.clear()
+                with self.settings(FAST_READ_SERIALIZERS=fast):
+                    responses.append(self.client.get(self.base_url, params).content)
+
+            self.assertEqual(*responses)
+
+        with self.settings(FAST_READ_SERIALIZERS=True):
+            cache.clear()
+            get_deadline(get_generation())
+            self.assertEqual(self.assert_list_within_budget(self.token_artist), 2)
+
+
+class TestEventViewsCache(EventViewsTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_owner.key}')
+        self.event = self.client.post(self.base_url, self.event_data, format='json').json()
+
+    def cache_lookups(self, result):
+        return get_store().counters[('easy_event_cache_requests_total', (('cache', 'events'), ('result', result)))]
+
+    @override_settings(METRICS_ENABLED=True, METRICS_DIR=None)
+    def test_artist_reads_are_served_from_cache(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_artist.key}')
+
+        first = self.client.get(f"{self.base_url}{self.event['id']}/")
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(f"{self.base_url}{self.event['id']}/")
+
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(len([query for query in queries if 'events_eventmodel' in query['sql']]), 0)
+        self.assertEqual(self.cache_lookups('hit'), 1)
+        self.assertEqual(self.cache_lookups('miss'), 1)
+
+    @override_settings(METRICS_ENABLED=True, METRICS_DIR=None)
+    def test_cache_is_invalidated_when_event_changes(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_artist.key}')
+        self.client.get(self.base_url)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_owner.key}')
+        self.event_data['details'] = 'details updated'
+        self.client.put(f"{self.base_url}{self.event['id']}/", self.event_data, format='json')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_artist.key}')
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(response.json()['results'][0]['details'], 'details updated')
+        self.assertEqual(self.cache_lookups('miss'), 2)
+
+    def test_cache_is_invalidated_when_music_styles_change(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_artist.key}')
+        self.client.get(self.base_url)
+
+        EventModel.objects.get(id=self.event['id']).music_styles.clear()
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(response.json()['results'][0]['music_styles'], [])
+
+    def test_cached_list_expires_when_an_event_starts(self):
+        starts_at = timezone.now() + timezone.timedelta(hours=1)
+        self.client.post(self.base_url, {**self.event_data, 'datetime': starts_at, 'repeat_event': 'None'},
+                         format='json')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_artist.key}')
+        self.assertEqual(len(self.client.get(self.base_url).json()['results']), 2)
+
+        with mock.patch('django.utils.timezone.now', return_value=starts_at + timezone.timedelta(seconds=1)):
+            response = self.client.get(self.base_url)
+
+        self.assertEqual([event['id'] for event in response.json()['results']], [self.event['id']])
+
+    def test_series_move_on_to_their_next_occurrence(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token_artist.key}')
+        starts_at = parse_datetime(self.event['datetime'])
+
+        with mock.patch('django.utils.timezone.now', return_value=starts_at + timezone.timedelta(seconds=1)):
+            self.assertEqual(self.client.get(self.base_url).json()['results'][0]['next_datetime'],
+                             self.event['next_datetime'])
+            call_command('refresh_occurrences', stdout=StringIO())
+            response = self.client.get(self.base_url)
+
+        self.assertEqual(parse_datetime(response.json()['results'][0]['next_datetime']),
+                         starts_at + timezone.timedelta(weeks=1))
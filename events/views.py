@@ -1,32 +1,86 @@
 from datetime import datetime
+from itertools import islice
 
-from django.shortcuts import get_object_or_404
+from adresses.geo import filter_near
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.http import Http404
 from django.utils import timezone
-from rest_framework import status, viewsets
-from rest_framework.authentication import TokenAuthentication
+from easy_event.fast_serializers import fast_reads_enabled, get_read_serializer
+from easy_event.identity_map import get_request_object_or_404
+from rest_framework import serializers, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from users.authentication import CachedTokenAuthentication
 from users.models import User
 
-from events.models import EventModel
+from events.cache import cached_response, invalidate_events_cache
+from events.models import EventModel, LineupEventModel
+from events.occurrences import (RECURRING, occurrences_in_window,
+                                window_prefilter)
+from events.pagination import EventCursorPagination
 from events.permissions import (IsOwnerOrIfUserReadOnly,
                                 IsOwnerResourceOrCreateRead)
+from events.search import full_text_search
 from events.serializers import (EventLineupCandidaturesSerializer,
-                                EventSerializer)
+                                EventOccurrencesSerializer,
+                                EventSearchSerializer, EventSerializer)
+
+
+def lineup_candidatures_queryset():
+    return EventModel.objects\
+                     .select_related('address')\
+                     .prefetch_related('music_styles', 'lineup_set', 'candidatures')
 
 
 class EventView(viewsets.ModelViewSet):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsOwnerOrIfUserReadOnly, IsOwnerResourceOrCreateRead]
     queryset = EventModel.objects.all()
     serializer_class = EventSerializer
+    pagination_class = EventCursorPagination
 
     def get_serializer_class(self):
         if self.request.method == 'GET' and self.request.user.is_superuser:
             return EventLineupCandidaturesSerializer
         return super().get_serializer_class()
 
+    def list(self, request, *args, **kwargs):
+        if request.user.is_superuser:
+            return super().list(request, *args, **kwargs)
+        if fast_reads_enabled():
+            return cached_response(request, self.list_values)
+        return cached_response(request, super().list, *args, **kwargs)
+
+    def list_values(self, request):
+        reader = get_read_serializer(EventSerializer)
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = self.paginator.get_ordering(request, queryset, self)
+
+        page = self.paginate_queryset(reader.values(queryset, *(field.lstrip('-') for field in ordering)))
+
+        return self.get_paginated_response(reader.serialize(page))
+
+    def retrieve(self, request, *args, **kwargs):
+        if request.user.is_superuser:
+            return super().retrieve(request, *args, **kwargs)
+        return cached_response(request, super().retrieve, *args, **kwargs)
+
+    def get_queryset(self):
+        if self.get_serializer_class() is EventLineupCandidaturesSerializer:
+            return lineup_candidatures_queryset()
+        return super().get_queryset().select_related('address').prefetch_related('music_styles')
+
+    def get_object(self):
+        if self.request.method in SAFE_METHODS:
+            return super().get_object()
+
+        event = get_request_object_or_404(self.request, EventModel, self.kwargs['pk'])
+        self.check_object_permissions(self.request, event)
+        return event
+
     def filter_queryset(self, queryset):
         queryset = super().filter_queryset(queryset)
 
@@ -34,47 +88,130 @@ class EventView(viewsets.ModelViewSet):
         if user.is_superuser:
             queryset = queryset.filter(owner=user)
         else:
-            queryset = queryset.filter(datetime__gte=timezone.now())
+            # Series never end; refresh_occurrences moves their next_datetime on.
+            queryset = queryset.filter(Q(next_datetime__gte=timezone.now()) | Q(repeat_event__in=RECURRING))
+
+        if self.action == 'list':
+            queryset = self.search_queryset(queryset)
         return queryset
 
+    def search_queryset(self, queryset):
+        search = EventSearchSerializer(data=self.request.query_params)
+        search.is_valid(raise_exception=True)
+        filters = dict(search.validated_data)
+
+        text = filters.pop('q', None)
+        if text:
+            queryset = full_text_search(queryset, text)
+            self.pagination_ordering = ('-relevance', 'id')
+
+        radius = filters.pop('radius')
+        near = filters.pop('near', None)
+        if near:
+            queryset = filter_near(queryset, *near, radius, prefix='address__')
+
+        music_styles = filters.pop('music_styles__name', None)
+        if music_styles:
+            styles = EventModel.music_styles.through.objects.filter(eventmodel_id=OuterRef('pk'),
+                                                                    musicstylemodel__name__in=music_styles.split(','))
+            queryset = queryset.filter(Exists(styles))
+
+        return queryset.filter(**filters)
+
+    @action(detail=False, methods=['get'])
+    def occurrences(self, request):
+        if request.user.is_superuser:
+            return self.list_occurrences(request)
+        return cached_response(request, self.list_occurrences)
+
+    def list_occurrences(self, request):
+        window = EventOccurrencesSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+        start, end, limit = (window.validated_data[field] for field in ('start', 'end', 'limit'))
+        if not request.user.is_superuser:
+            # Artists only see what has not started, as in the list.
+            start = max(start, timezone.now())
+
+        candidates = window_prefilter(self.filter_queryset(EventModel.objects.all()), start, end)\
+            .only('id', 'datetime', 'repeat_event')
+        occurrences = list(islice(occurrences_in_window(candidates, start, end), limit))
+
+        events = self.get_queryset().filter(id__in={event.id for _, event in occurrences})
+        serialized = {event['id']: event for event in self.get_serializer(events, many=True).data}
+        datetime_field = serializers.DateTimeField()
+
+        return Response([
+            {'datetime': datetime_field.to_representation(occurrence), 'event': serialized[event.id]}
+            for occurrence, event in occurrences
+        ])
+
     @action(detail=True, methods=['patch'])
     def lineup(self, request, pk):
-        event = get_object_or_404(EventModel, id=int(pk))
-
+        event = get_request_object_or_404(request, EventModel, pk)
+        # Like lineup.add(), an artist is only added once; the first entry wins.
+        lineup_data = {}
         for artist_data in request.data['lineup']:
-            artist = get_object_or_404(User, id=artist_data['artist_id'])
+            lineup_data.setdefault(int(artist_data['artist_id']), artist_data)
+        artist_ids = list(lineup_data)
+
+        is_candidate = Exists(EventModel.candidatures.through.objects.filter(eventmodel_id=event.id, user_id=OuterRef('pk')))
+        in_lineup = Exists(LineupEventModel.objects.filter(event_id=event.id, artist_id=OuterRef('pk')))
+        artists = {artist_id: (candidate, added) for artist_id, candidate, added in User.objects
+                   .filter(id__in=artist_ids)
+                   .annotate(is_candidate=is_candidate, in_lineup=in_lineup)
+                   .values_list('id', 'is_candidate', 'in_lineup')}
+
+        lineups = []
+        for artist_id, artist_data in lineup_data.items():
+            if artist_id not in artists:
+                raise Http404
+
             artist_performance_day = datetime.strptime(artist_data['performance_datetime'], '%Y-%m-%d %H:%M:%S').day
 
-            if event.datetime.day >= artist_performance_day:
-                if artist in event.candidatures.all():
-                    event.lineup.add(artist, through_defaults={'performance_datetime': artist_data['performance_datetime']})
-                    event.candidatures.remove(artist)
-                else:
-                    return Response({
-                        'error': f'Artist with id {artist.id} not in candidatures'
-                        }, status.HTTP_400_BAD_REQUEST)
-            else:
+            if event.datetime.day < artist_performance_day:
                 return Response({
                     'error': f"Performance datetime day is after event day for artist with id {artist_data['artist_id']}"
                     }, status.HTTP_400_BAD_REQUEST)
 
+            is_candidate, in_lineup = artists[artist_id]
+            if not is_candidate:
+                return Response({
+                    'error': f'Artist with id {artist_id} not in candidatures'
+                    }, status.HTTP_400_BAD_REQUEST)
+
+            if not in_lineup:
+                lineups.append(LineupEventModel(event=event, artist_id=artist_id,
+                                                performance_datetime=artist_data['performance_datetime']))
+
+        with transaction.atomic():
+            LineupEventModel.objects.bulk_create(lineups)
+            EventModel.candidatures.through.objects.filter(eventmodel_id=event.id, user_id__in=artist_ids).delete()
+        invalidate_events_cache()
+
+        event = lineup_candidatures_queryset().get(id=event.id)
         serialized = EventLineupCandidaturesSerializer(event)
         return Response(serialized.data)
 
 
 class EventCandidatureView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def patch(self, request, *args, **kwargs):
-        event = get_object_or_404(EventModel, id=kwargs.get('pk'))
+        event = get_request_object_or_404(request, EventModel, kwargs.get('pk'))
         if request.user.is_superuser:
-            for artist_id in request.data['remove_artists']:
-                artist = get_object_or_404(User, id=artist_id)
-                event.candidatures.remove(artist)
+            artist_ids = [int(artist_id) for artist_id in request.data['remove_artists']]
+            candidatures = EventModel.candidatures.through.objects.filter(eventmodel_id=event.id, user_id__in=artist_ids)
+
+            with transaction.atomic():
+                removed_ids = set(candidatures.values_list('user_id', flat=True))
+                candidatures.delete()
+            invalidate_events_cache()
 
+            event = lineup_candidatures_queryset().get(id=event.id)
             serialized = EventLineupCandidaturesSerializer(event)
-            return Response(serialized.data)
+            missing_artists = [artist_id for artist_id in artist_ids if artist_id not in removed_ids]
+            return Response({**serialized.data, 'missing_artists': missing_artists})
 
-        artist = get_object_or_404(User, id=request.user.id)
+        artist = get_request_object_or_404(request, User, request.user.id)
         event.candidatures.add(artist)
         return Response({'msg': 'Application made successfully'})
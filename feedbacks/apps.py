@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FeedbacksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'feedbacks'
+
+    def ready(self):
+        import feedbacks.signals  # noqa: F401
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.9 on 2026-10-18 08:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedbacks', '0003_auto_20211202_1815'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='feedbackmodel',
+            constraint=models.UniqueConstraint(fields=('from_user', 'addressed_user', 'event'), name='unique_feedback_per_event'),
+        ),
+    ]
@@ -8,3 +8,8 @@ class FeedbackModel(models.Model):
     event = models.ForeignKey('events.EventModel', null=False, on_delete=models.PROTECT)
     addressed_user = models.ForeignKey('users.User', null=False, on_delete=models.CASCADE, related_name='feedbacks_received')
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['from_user', 'addressed_user', 'event'], name='unique_feedback_per_event'),
+        ]
+
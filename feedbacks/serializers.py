@@ -3,6 +3,7 @@ from rest_framework import serializers, status
 from users.serializers import UserSerializer
 from rest_framework.exceptions import ValidationError
 from feedbacks.models import FeedbackModel
+from django.db import transaction
 from django.db.utils import IntegrityError
 
 class DynamicFieldsModelFeedbackSerializer(serializers.ModelSerializer):
@@ -32,13 +33,24 @@ class FeedbackSerializer(DynamicFieldsModelFeedbackSerializer):
         addressed_user = self.initial_data['addressed_user']
         event = self.initial_data['event']
 
-        return FeedbackModel.objects.get_or_create(**validated_data, from_user=from_user, addressed_user=addressed_user, event=event)[0]
+        try:
+            with transaction.atomic():
+                return FeedbackModel.objects.create(**validated_data, from_user=from_user, addressed_user=addressed_user, event=event)
+        except IntegrityError:
+            # Only a concurrent duplicate gets the 409 message; the savepoint
+            # is rolled back, so look for the row that won.
+            if self.feedback_exists():
+                raise IntegrityError('You already made this feedback')
+            raise
+
+    def feedback_exists(self):
+        return FeedbackModel.objects.filter(from_user=self.initial_data['from_user'],
+                                            addressed_user=self.initial_data['addressed_user'],
+                                            event=self.initial_data['event']).exists()
 
     def validate(self, attrs):
 
-        addressed_user_feedbacks = self.initial_data['addressed_user'].feedbacks_received.get_queryset()
-
-        if self.initial_data['from_user'] in [feedback.from_user for feedback in addressed_user_feedbacks]:
+        if self.feedback_exists():
             raise IntegrityError('You already made this feedback')
 
         if self.initial_data['from_user'].is_superuser == self.initial_data['addressed_user'].is_superuser:
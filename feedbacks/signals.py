@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from users.models import RatingSummaryModel
+
+from feedbacks.models import FeedbackModel
+
+
+@receiver(post_save, sender=FeedbackModel)
+def add_feedback_to_rating(instance, created, **_):
+    if created:
+        RatingSummaryModel.apply_feedback(instance.addressed_user_id, instance.stars)
+
+
+@receiver(post_delete, sender=FeedbackModel)
+def remove_feedback_from_rating(instance, **_):
+    RatingSummaryModel.apply_feedback(instance.addressed_user_id, instance.stars, delta=-1)
@@ -0,0 +1,148 @@
+import json
+from unittest import mock
+
+from adresses.models import AdressesModel
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from events.models import EventModel
+from feedbacks.models import FeedbackModel
+from feedbacks.serializers import FeedbackSerializer
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class FeedbackViewsTest(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='123',
+            is_superuser=True
+        )
+
+        self.address = AdressesModel.objects.create(
+            street='E 39th St',
+            neighbourhood='Murray Hill',
+            number=39,
+            city='New York',
+            state='NY',
+            country='New York',
+        )
+
+        self.event = EventModel.objects.create(
+            datetime=timezone.now(),
+            address=self.address,
+            owner=self.owner,
+            details='details',
+            base_price=9.99
+        )
+
+    def create_feedbacks(self, amount):
+        for index in range(FeedbackModel.objects.count(), FeedbackModel.objects.count() + amount):
+            artist = User.objects.create_user(
+                username=f'artist{index}',
+                email=f'artist{index}@example.com',
+                password='123'
+            )
+            FeedbackModel.objects.create(
+                from_user=artist,
+                addressed_user=self.owner,
+                event=self.event,
+                description='description',
+                stars=index % 5 + 1
+            )
+
+    def test_list_feedbacks_queries_do_not_grow_with_feedbacks(self):
+        self.create_feedbacks(2)
+        with CaptureQueriesContext(connection) as few_feedbacks_queries:
+            self.client.get('/api/feedbacks/')
+
+        self.create_feedbacks(10)
+        with CaptureQueriesContext(connection) as many_feedbacks_queries:
+            response = self.client.get('/api/feedbacks/')
+
+        self.assertEqual(len(response.json()), 12)
+        self.assertEqual(len(few_feedbacks_queries), len(many_feedbacks_queries))
+
+    def test_list_feedbacks_paginated(self):
+        self.create_feedbacks(5)
+
+        response = self.client.get('/api/feedbacks/', {'page': 2, 'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 5)
+        self.assertEqual([feedback['id'] for feedback in response.json()['results']], [3, 4])
+
+    def test_export_feedbacks_as_ndjson(self):
+        self.create_feedbacks(5)
+        feedbacks = self.client.get('/api/feedbacks/', {'addressedUser': self.owner.id}).json()
+
+        response = self.client.get('/api/feedbacks/', {'addressedUser': self.owner.id, 'export': 'ndjson'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual([json.loads(line) for line in lines], feedbacks)
+
+    def test_fast_serializers_render_the_same_feedbacks(self):
+        self.create_feedbacks(3)
+        artist = User.objects.get(username='artist0')
+
+        for url, params in (('/api/feedbacks/', {}), ('/api/feedbacks/', {'fromUser': artist.id}),
+                            ('/api/feedbacks/', {'page': 1, 'page_size': 2}),
+                            ('/api/feedbacks/', {'export': 'ndjson'}),
+                            (f'/api/events/{self.event.id}/feedbacks/', {})):
+            responses = []
+            for fast in (False, True):
+                with self.settings(FAST_READ_SERIALIZERS=fast):
+                    response = self.client.get(url, params)
+                    responses.append(b''.join(response.streaming_content) if response.streaming else response.content)
+
+            self.assertEqual(*responses)
+
+    def test_create_duplicated_feedback_returns_conflict(self):
+        artist = User.objects.create_user(username='artist', email='artist@example.com', password='123')
+        token = Token.objects.create(user=self.owner)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        feedback = {'description': 'description', 'stars': 5, 'addressed_user': artist.id}
+        first = self.client.post(f'/api/events/{self.event.id}/feedbacks/', feedback, format='json')
+        second = self.client.post(f'/api/events/{self.event.id}/feedbacks/', feedback, format='json')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 409)
+        self.assertEqual(second.json(), {'error': 'You already made this feedback'})
+        self.assertEqual(FeedbackModel.objects.count(), 1)
+
+    def test_concurrent_duplicated_feedback_returns_conflict(self):
+        artist = User.objects.create_user(username='artist', email='artist@example.com', password='123')
+        token = Token.objects.create(user=self.owner)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        feedback = {'description': 'description', 'stars': 5, 'addressed_user': artist.id}
+        self.client.post(f'/api/events/{self.event.id}/feedbacks/', feedback, format='json')
+
+        # The other request inserted its row after this one was validated.
+        with mock.patch.object(FeedbackSerializer, 'validate', lambda serializer, attrs: attrs):
+            response = self.client.post(f'/api/events/{self.event.id}/feedbacks/', feedback, format='json')
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json(), {'error': 'You already made this feedback'})
+
+    def test_rating_summary_follows_feedbacks(self):
+        self.create_feedbacks(3)
+        FeedbackModel.objects.first().delete()
+
+        token = Token.objects.create(user=self.owner)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        response = self.client.get(f'/api/accounts/{self.owner.id}/')
+
+        self.assertEqual(response.json()['rating'], {
+            'count': 2,
+            'total_stars': 5,
+            'average': 2.5,
+            'histogram': {'1': 0, '2': 1, '3': 1, '4': 0, '5': 0},
+        })
@@ -1,59 +1,91 @@
+import json
+
 from django.db.utils import IntegrityError
-from django.shortcuts import get_object_or_404
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
+from easy_event.fast_serializers import get_read_serializer
+from easy_event.identity_map import (get_request_object,
+                                     get_request_object_or_404)
 from events.models import EventModel
 from rest_framework import status, viewsets
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.decorators import (api_view)
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from users.authentication import CachedTokenAuthentication
 from users.models import User
 
 from feedbacks.models import FeedbackModel
+from feedbacks.pagination import FeedbackPagination
 from feedbacks.serializers import FeedbackSerializer
 
 
+FEEDBACK_EXPORT_CHUNK_SIZE = 500
+
+
+def stream_feedbacks(queryset, reader):
+    chunk = []
+
+    for feedback in reader.values(queryset).iterator(chunk_size=FEEDBACK_EXPORT_CHUNK_SIZE):
+        chunk.append(feedback)
+
+        if len(chunk) == FEEDBACK_EXPORT_CHUNK_SIZE:
+            yield serialize_ndjson(chunk, reader)
+            chunk = []
+
+    if chunk:
+        yield serialize_ndjson(chunk, reader)
+
+
+def serialize_ndjson(feedbacks, reader):
+    return ''.join(json.dumps(feedback, cls=JSONEncoder) + '\n' for feedback in reader.serialize(feedbacks))
+
+
 @api_view(['get'])
 def get_feedbacks(request):
-    queryset = FeedbackModel.objects.all()
+    queryset = FeedbackModel.objects\
+                            .select_related('from_user', 'addressed_user', 'event__owner')\
+                            .order_by('id')
     standard_serializer_fields = ['id', 'description', 'stars', 'event']
-
-    serializer = FeedbackSerializer(queryset, many = True,
-            fields=[*standard_serializer_fields, 'from_user', 'addressed_user'])
+    fields = [*standard_serializer_fields, 'from_user', 'addressed_user']
 
     from_user = request.query_params.get('fromUser')
     addressed_user = request.query_params.get('addressedUser')
 
     if from_user:
-
         queryset = queryset.filter(from_user=from_user)
-
-        serializer = FeedbackSerializer(queryset, many = True,
-                fields=[*standard_serializer_fields, 'addressed_user'])
+        fields = [*standard_serializer_fields, 'addressed_user']
 
     if addressed_user:
         queryset = queryset.filter(addressed_user=addressed_user)
+        fields = [*standard_serializer_fields, 'from_user']
+
+    reader = get_read_serializer(FeedbackSerializer, fields=fields)
+
+    if request.query_params.get('export') == 'ndjson':
+        return StreamingHttpResponse(stream_feedbacks(queryset, reader), content_type='application/x-ndjson')
+
+    if 'page' in request.query_params:
+        paginator = FeedbackPagination()
+        page = paginator.paginate_queryset(reader.values(queryset), request)
 
-        serializer = FeedbackSerializer(queryset, many = True,
-                fields=[*standard_serializer_fields, 'from_user'])
+        return paginator.get_paginated_response(reader.serialize(page))
 
-    return Response(serializer.data)
+    return Response(reader.serialize(reader.values(queryset)))
 
 class FeedbackViews(viewsets.ViewSet):
     queryset = FeedbackModel.objects.all()
     serializer_class = FeedbackSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
-    def list(self, _, event_id: int = ''):
+    def list(self, request, event_id: int = ''):
         try:
-            get_object_or_404(EventModel, id=event_id)
+            get_request_object_or_404(request, EventModel, event_id)
             queryset = FeedbackModel.objects\
                                     .all()\
                                     .filter(event_id=event_id)
 
-            serializer = FeedbackSerializer(queryset, many = True,
-                fields=['id', 'description', 'stars'])
+            reader = get_read_serializer(FeedbackSerializer, fields=['id', 'description', 'stars'])
 
-            return Response(serializer.data)
+            return Response(reader.serialize(reader.values(queryset)))
         except Http404:
             return Response({'error': 'Event not founded!'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -64,15 +96,15 @@ class FeedbackViews(viewsets.ViewSet):
         current_user = self.request.user
 
         try:
-            found_event = EventModel.objects.get(id=event_id)
+            found_event = get_request_object(request, EventModel, event_id)
 
             data['from_user'] = current_user
 
-            data['addressed_user'] = User.objects.get(id=data['addressed_user'])
+            data['addressed_user'] = get_request_object(request, User, data['addressed_user'])
 
             data['event'] = found_event
 
-            if found_event.owner.id == current_user.id or\
+            if found_event.owner_id == current_user.id or\
                 current_user in found_event.lineup.get_queryset():
 
                     serializer = FeedbackSerializer(data=request.data)
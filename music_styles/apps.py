@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class MusicStylesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'music_styles'
+
+    def ready(self):
+        import music_styles.signals  # noqa: F401
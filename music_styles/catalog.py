@@ -0,0 +1,74 @@
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+from music_styles.models import MusicStyleModel
+
+GENERATION_KEY = 'music_styles:generation'
+
+_catalog = {}
+_generation = None
+_lock = threading.Lock()
+
+
+def get_generation():
+    generation = cache.get(GENERATION_KEY)
+
+    if generation is None:
+        cache.add(GENERATION_KEY, uuid.uuid4().hex, None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def remember(names_to_ids, generation):
+    with _lock:
+        if generation == _generation:
+            _catalog.update(names_to_ids)
+
+
+def invalidate_catalog():
+    global _generation
+
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, None)
+    with _lock:
+        _catalog.clear()
+        _generation = None
+
+
+def resolve_music_style_ids(names):
+    """
+    Returns the ids of the music styles called ``names``, creating the
+    unknown ones with a single conflict-ignoring bulk insert.
+
+    Ids are only cached once the transaction that read them commits, so a
+    rolled back insert never leaves a dangling id in the catalog. The
+    catalog is dropped whenever the shared generation changes, which any
+    worker does when a style is saved or deleted; an evicted generation
+    only costs a reload.
+    """
+    global _generation
+
+    names = list(dict.fromkeys(names))
+    generation = get_generation()
+
+    with _lock:
+        if generation != _generation:
+            _catalog.clear()
+            _generation = generation
+        ids = {name: _catalog[name] for name in names if name in _catalog}
+
+    missing = [name for name in names if name not in ids]
+    if missing:
+        found = dict(MusicStyleModel.objects.filter(name__in=missing).values_list('name', 'id'))
+        unknown = [name for name in missing if name not in found]
+
+        if unknown:
+            MusicStyleModel.objects.bulk_create([MusicStyleModel(name=name) for name in unknown], ignore_conflicts=True)
+            found.update(MusicStyleModel.objects.filter(name__in=unknown).values_list('name', 'id'))
+
+        ids.update(found)
+        transaction.on_commit(lambda: remember(found, generation))
+
+    return [ids[name] for name in names]
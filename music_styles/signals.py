@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from music_styles.catalog import invalidate_catalog
+from music_styles.models import MusicStyleModel
+
+
+@receiver(post_save, sender=MusicStyleModel)
+@receiver(post_delete, sender=MusicStyleModel)
+def invalidate_catalog_on_change(**_):
+    invalidate_catalog()
@@ -0,0 +1,127 @@
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+TOKEN_CACHE_SIZE = getattr(settings, 'AUTH_TOKEN_CACHE_SIZE', 1024)
+TOKEN_CACHE_TTL = getattr(settings, 'AUTH_TOKEN_CACHE_TTL', 60)
+REVOCATION_KEY = 'users:token_revocation:{}'
+
+
+def _revocation(user_id):
+    return cache.get(REVOCATION_KEY.format(user_id))
+
+
+def _current_revocation(user_id):
+    revocation = _revocation(user_id)
+
+    if revocation is None:
+        cache.add(REVOCATION_KEY.format(user_id), uuid.uuid4().hex, None)
+        revocation = _revocation(user_id)
+    return revocation
+
+
+class TokenCache:
+    """
+    Process-local LRU of token key -> (user, token) with a TTL.
+
+    Revoking a user's tokens stores a new revocation marker for that user in
+    the shared Django cache (see ``CACHES``), so entries cached by other
+    worker processes for that user are discarded on their next lookup.
+    Every cached entry was stored with a marker, so a marker the cache has
+    evicted since also discards the entry: the token is checked against
+    the database again instead of trusted.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        user, token, expires_at, revocation = entry
+        current = _revocation(user.id)
+        if expires_at < time.monotonic() or current is None or current != revocation:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+        user = copy.copy(user)
+        token = copy.copy(token)
+        token.user = user
+        return user, token
+
+    def set(self, key, user, token):
+        revocation = _current_revocation(user.id)
+
+        with self._lock:
+            self._entries[key] = (copy.copy(user), copy.copy(token), time.monotonic() + self.ttl, revocation)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revoke(self, key=None, user_id=None):
+        with self._lock:
+            if key is not None:
+                self._entries.pop(key, None)
+
+            if user_id is not None:
+                for cached_key, (user, *_) in list(self._entries.items()):
+                    if user.id == user_id:
+                        del self._entries[cached_key]
+
+        if user_id is not None:
+            cache.set(REVOCATION_KEY.format(user_id), uuid.uuid4().hex, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    def authenticate_credentials(self, key):
+        credentials = token_cache.get(key)
+
+        if credentials is None:
+            user, token = super().authenticate_credentials(key)
+            token_cache.set(key, user, token)
+            credentials = (user, token)
+
+        return credentials
+
+
+def is_staff_request(request):
+    """
+    Whether a plain Django request comes from a staff user, authenticating
+    its token when no session user is set.
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user.is_staff
+
+    try:
+        credentials = CachedTokenAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return False
+    return credentials is not None and credentials[0].is_staff
@@ -0,0 +1,39 @@
+from django.db import migrations
+from django.db.models import Avg, Count, Q, Sum
+
+
+def backfill_rating_summaries(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    RatingSummaryModel = apps.get_model('users', 'RatingSummaryModel')
+
+    histogram = {f'stars_{stars}': Count('feedbacks_received', filter=Q(feedbacks_received__stars=stars))
+                 for stars in range(1, 6)}
+    users = User.objects.annotate(
+        feedbacks_count=Count('feedbacks_received'),
+        feedbacks_total_stars=Sum('feedbacks_received__stars'),
+        feedbacks_average=Avg('feedbacks_received__stars'),
+        **histogram,
+    )
+
+    RatingSummaryModel.objects.bulk_create([
+        RatingSummaryModel(
+            user_id=user.id,
+            count=user.feedbacks_count,
+            total_stars=user.feedbacks_total_stars or 0,
+            average=user.feedbacks_average or 0,
+            **{field: getattr(user, field) for field in histogram},
+        )
+        for user in users.iterator()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_ratingsummarymodel'),
+        ('feedbacks', '0004_feedbackmodel_unique_feedback_per_event'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rating_summaries, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Cast
 from django.contrib.auth.models import AbstractUser
 
 class User(AbstractUser):
@@ -6,3 +8,39 @@ class User(AbstractUser):
     phone = models.CharField(max_length=15, blank=True, null=True)
     solo = models.BooleanField(blank=True, null=True)
     hour_price = models.FloatField(blank=True, null=True)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['hour_price'], condition=models.Q(is_superuser=False), name='user_artist_price_idx'),
+            models.Index(fields=['username'], condition=models.Q(is_superuser=True), name='user_owner_username_idx'),
+        ]
+
+
+class RatingSummaryModel(models.Model):
+    user = models.OneToOneField('users.User', primary_key=True, on_delete=models.CASCADE, related_name='rating_summary')
+    count = models.PositiveIntegerField(default=0)
+    total_stars = models.PositiveIntegerField(default=0)
+    average = models.FloatField(default=0, db_index=True)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def apply_feedback(cls, user_id, stars, delta=1):
+        count = F('count') + delta
+        total_stars = F('total_stars') + stars * delta
+        histogram = {f'stars_{stars}': F(f'stars_{stars}') + delta} if 1 <= stars <= 5 else {}
+
+        updated = cls.objects.filter(user_id=user_id).update(
+            count=count,
+            total_stars=total_stars,
+            average=Case(When(count=-delta, then=Value(0.0)),
+                         default=Cast(total_stars, models.FloatField()) / count),
+            **histogram,
+        )
+
+        if not updated and delta > 0:
+            histogram = {f'stars_{stars}': 1} if 1 <= stars <= 5 else {}
+            cls.objects.create(user_id=user_id, count=1, total_stars=stars, average=stars, **histogram)
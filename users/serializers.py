@@ -1,7 +1,7 @@
 from rest_framework import serializers, status
 from rest_framework.exceptions import ValidationError
 
-from users.models import User
+from users.models import RatingSummaryModel, User
 
 
 class DynamicFieldsModelUserSerializer(serializers.ModelSerializer):
@@ -67,6 +67,34 @@ class UserSerializer(DynamicFieldsModelUserSerializer):
                                       code=status.HTTP_400_BAD_REQUEST)
         return super().validate(attrs)
 
+class RatingSummarySerializer(serializers.ModelSerializer):
+    histogram = serializers.SerializerMethodField()
+
+    class Meta:
+        model = RatingSummaryModel
+        fields = ('count', 'total_stars', 'average', 'histogram',)
+
+    def get_histogram(self, summary):
+        return {str(stars): getattr(summary, f'stars_{stars}') for stars in range(1, 6)}
+
+class UserRatingSerializer(UserSerializer):
+    rating = RatingSummarySerializer(source='rating_summary', read_only=True)
+
+    class Meta(UserSerializer.Meta):
+        fields = (*UserSerializer.Meta.fields, 'rating',)
+
+class DirectorySearchSerializer(serializers.Serializer):
+    ordering = serializers.ChoiceField(choices=['username', '-username'], required=False)
+
+
+class ArtistSearchSerializer(DirectorySearchSerializer):
+    ordering = serializers.ChoiceField(choices=['username', '-username', 'hour_price', '-hour_price',
+                                                'rating', '-rating'], required=False)
+    solo = serializers.BooleanField(required=False)
+    hour_price__gte = serializers.FloatField(required=False)
+    hour_price__lte = serializers.FloatField(required=False)
+    minRating = serializers.FloatField(required=False, min_value=0, max_value=5)
+
 class LoginSerializer(serializers.Serializer):
     username = serializers.CharField(required=True)
     password = serializers.CharField()
@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from users.authentication import token_cache
+from users.models import RatingSummaryModel, User
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def revoke_cached_token(instance, **_):
+    token_cache.revoke(key=instance.key, user_id=instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def revoke_cached_user_tokens(instance, created=False, **_):
+    if not created:
+        token_cache.revoke(user_id=instance.id)
+
+
+@receiver(post_save, sender=User)
+def create_rating_summary(instance, created, **_):
+    if created:
+        RatingSummaryModel.objects.create(user=instance)
@@ -1,5 +1,11 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
+from users.authentication import REVOCATION_KEY, TokenCache
+from users.models import User
 
 class UserAccountViewsTest(TestCase):
     def setUp(self) -> None:
@@ -202,7 +208,7 @@ class UserAccountViewsTest(TestCase):
 
         artists = self.client.get('/api/accounts/artists/', format='json')
 
-        self.assertEqual(len(artists.json()), 2)
+        self.assertEqual(len(artists.json()['results']), 2)
         self.assertEqual(artists.status_code, 200)
 
     def test_get_all_and_only_owners(self):
@@ -218,9 +224,71 @@ class UserAccountViewsTest(TestCase):
 
         owners = self.client.get('/api/accounts/owners/', format='json')
 
-        self.assertEqual(len(owners.json()), 2)
+        self.assertEqual(len(owners.json()['results']), 2)
         self.assertEqual(owners.status_code, 200)
 
+    def test_filter_and_order_artists_directory(self):
+        self.client.post('/api/accounts/', self.artist1_data, format='json')
+        self.client.post('/api/accounts/', self.artist2_data, format='json')
+        self.client.post('/api/accounts/', {**self.artist2_data, 'username': 'Queen', 'email': 'queen@gmail.com',
+                                            'hour_price': 500.0}, format='json')
+        self.client.post('/api/accounts/', self.owner_event1_data, format='json')
+
+        response = self.client.get('/api/accounts/artists/', {'ordering': '-hour_price', 'page_size': 2})
+        page = response.json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([artist['username'] for artist in page['results']], ['Queen', 'Mamonas'])
+        self.assertEqual([artist['username'] for artist in self.client.get(page['next']).json()['results']],
+                         ['LadyGaga'])
+
+        response = self.client.get('/api/accounts/artists/', {'solo': 'false', 'hour_price__lte': 300})
+        self.assertEqual([artist['username'] for artist in response.json()['results']], ['Mamonas'])
+
+        response = self.client.get('/api/accounts/artists/', {'ordering': 'price'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_unpriced_artists_sort_last_by_price(self):
+        self.client.post('/api/accounts/', self.artist1_data, format='json')
+        self.client.post('/api/accounts/', self.artist2_data, format='json')
+        User.objects.create_user(username='Unpriced', email='unpriced@gmail.com', password='123', solo=True)
+
+        for ordering in ('hour_price', '-hour_price'):
+            response = self.client.get('/api/accounts/artists/', {'ordering': ordering, 'page_size': 1})
+            usernames = [artist['username'] for artist in response.json()['results']]
+
+            while response.json()['next']:
+                response = self.client.get(response.json()['next'])
+                usernames += [artist['username'] for artist in response.json()['results']]
+
+            self.assertEqual(len(usernames), 3)
+            self.assertEqual(usernames[-1], 'Unpriced')
+
+    def test_fast_serializers_render_the_same_owners(self):
+        self.client.post('/api/accounts/', self.owner_event1_data, format='json')
+        self.client.post('/api/accounts/', self.owner_event2_data, format='json')
+
+        for params in ({}, {'ordering': '-username', 'page_size': 1}):
+            responses = []
+            for fast in (False, True):
+                with self.settings(FAST_READ_SERIALIZERS=fast):
+                    responses.append(self.client.get('/api/accounts/owners/', params).content)
+
+            self.assertEqual(*responses)
+
+    def test_directories_only_load_listed_columns(self):
+        self.client.post('/api/accounts/', self.artist1_data, format='json')
+        self.client.post('/api/accounts/', self.owner_event1_data, format='json')
+
+        for url in ('/api/accounts/artists/', '/api/accounts/owners/'):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {'ordering': 'username'})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(queries), 1)
+            self.assertNotIn('"password"', queries[0]['sql'])
+            self.assertNotIn('"last_login"', queries[0]['sql'])
+
 
     def test_update_account(self):
         artist = self.client.post('/api/accounts/', self.artist1_data, format='json')
@@ -373,3 +441,51 @@ class UserAccountViewsTest(TestCase):
         response = self.client.delete('/api/accounts/10/')
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json(), {'error': 'User not founded.'})
+
+    def test_cached_token_is_revoked_when_account_is_deleted(self):
+        self.client.post('/api/accounts/', self.owner_event2_data, format='json')
+        token = self.client.post('/api/login/', self.owner_event2_login_data, format='json').json()['token']
+
+        self.client.credentials(HTTP_AUTHORIZATION = 'Token ' + token)
+        self.client.get('/api/accounts/1/')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/accounts/1/')
+        self.assertFalse([query for query in queries if 'authtoken_token' in query['sql']])
+
+        response = self.client.delete('/api/accounts/1/')
+        self.assertEqual(response.status_code, 204)
+
+        response = self.client.get('/api/accounts/1/')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"detail": "Invalid token."})
+
+
+class TokenCacheRevocationTest(TestCase):
+    def test_revocation_reaches_other_workers_and_only_that_user(self):
+        cache.clear()
+        tokens = [Token.objects.create(user=User.objects.create_user(username=name, email=f'{name}@example.com',
+                                                                     password='123'))
+                  for name in ('first', 'second')]
+        worker, other_worker = TokenCache(10, 60), TokenCache(10, 60)
+        for token_cache in (worker, other_worker):
+            for token in tokens:
+                token_cache.set(token.key, token.user, token)
+
+        worker.revoke(key=tokens[0].key, user_id=tokens[0].user_id)
+
+        self.assertIsNone(other_worker.get(tokens[0].key))
+        self.assertEqual(other_worker.get(tokens[1].key)[0].id, tokens[1].user_id)
+
+    def test_evicted_revocation_marker_discards_cached_tokens(self):
+        cache.clear()
+        token = Token.objects.create(user=User.objects.create_user(username='first', email='first@example.com',
+                                                                   password='123'))
+        worker, other_worker = TokenCache(10, 60), TokenCache(10, 60)
+        worker.set(token.key, token.user, token)
+        other_worker.set(token.key, token.user, token)
+
+        other_worker.revoke(key=token.key, user_id=token.user_id)
+        cache.delete(REVOCATION_KEY.format(token.user_id))
+
+        self.assertIsNone(worker.get(token.key))
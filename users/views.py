@@ -1,5 +1,7 @@
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Coalesce
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication, authenticate
+from rest_framework.authentication import authenticate
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import api_view
 from rest_framework.exceptions import ValidationError
@@ -7,24 +9,71 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from easy_event.fast_serializers import SerializerReader, get_read_serializer
+from easy_event.identity_map import get_request_object
+from users.authentication import CachedTokenAuthentication
 from users.models import User
-from users.serializers import LoginSerializer, UserSerializer
+from users.pagination import UserCursorPagination
+from users.serializers import (ArtistSearchSerializer,
+                               DirectorySearchSerializer, LoginSerializer,
+                               UserRatingSerializer, UserSerializer)
 
 
+OWNER_FIELDS = ['id', 'username', 'email', 'is_superuser']
+ARTIST_FIELDS = ['id', 'username', 'email', 'is_superuser', 'phone', 'solo', 'hour_price',
+                 *(f'rating_summary__{field}' for field in ('count', 'total_stars', 'average', 'stars_1',
+                                                            'stars_2', 'stars_3', 'stars_4', 'stars_5'))]
+
+DIRECTORY_ORDERING = {
+    'username': ('username',),
+    '-username': ('-username',),
+    'hour_price': ('price_order', 'id'),
+    '-hour_price': ('-price_order', '-id'),
+    'rating': ('average_rating', 'id'),
+    '-rating': ('-average_rating', '-id'),
+}
+
+def paginate_directory(request, queryset, ordering, reader):
+    paginator = UserCursorPagination(DIRECTORY_ORDERING.get(ordering))
+    columns = (field.lstrip('-') for field in paginator.get_ordering(request, queryset, None))
+
+    page = paginator.paginate_queryset(reader.values(queryset, *columns), request)
+
+    return paginator.get_paginated_response(reader.serialize(page))
+
 @api_view(['get'])
-def get_owners(_):
-        owners = User.objects.filter(is_superuser=True)
+def get_owners(request):
+        search = DirectorySearchSerializer(data=request.query_params)
+        search.is_valid(raise_exception=True)
 
-        serializer = UserSerializer(owners, fields=['id', 'username', 'email', 'is_superuser', 'password'], many=True)
+        owners = User.objects.filter(is_superuser=True).only(*OWNER_FIELDS)
 
-        return Response(serializer.data)
+        return paginate_directory(request, owners, search.validated_data.get('ordering'),
+                                  get_read_serializer(UserSerializer, fields=OWNER_FIELDS))
 
 @api_view(['get'])
-def get_artists(_):
-        artists = User.objects.filter(is_superuser=False)
-        serializer = UserSerializer(artists,many=True)
+def get_artists(request):
+        search = ArtistSearchSerializer(data=request.query_params.dict())
+        search.is_valid(raise_exception=True)
+        filters = dict(search.validated_data)
 
-        return Response(serializer.data)
+        ordering = filters.pop('ordering', None)
+        min_rating = filters.pop('minRating', None)
+
+        artists = User.objects.filter(is_superuser=False, **filters).select_related('rating_summary').only(*ARTIST_FIELDS)
+
+        if min_rating is not None:
+            artists = artists.filter(rating_summary__average__gte=min_rating)
+
+        if ordering in ('rating', '-rating'):
+            artists = artists.annotate(average_rating=F('rating_summary__average'))
+
+        if ordering in ('hour_price', '-hour_price'):
+            # Unpriced artists sort last either way, and the cursor never holds a NULL.
+            missing = float('inf') if ordering == 'hour_price' else float('-inf')
+            artists = artists.annotate(price_order=Coalesce('hour_price', Value(missing, output_field=FloatField())))
+
+        return paginate_directory(request, artists, ordering, SerializerReader(UserRatingSerializer))
 
 @api_view(['post'])
 def login(request):
@@ -82,7 +131,7 @@ class CreateAccountsView(APIView):
             return Response(e.detail, status=e.status_code)
 
 class RetrieveUpdateOrDeleteAccountView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def put(self, request, account_id: int = ''):
@@ -90,7 +139,7 @@ class RetrieveUpdateOrDeleteAccountView(APIView):
         data = request.data
 
         try:
-            instance = User.objects.get(id=account_id)
+            instance = get_request_object(request, User, account_id)
 
             if  self.request.user.id != instance.id:
                 return Response({"detail": "You do not have permission to perform this action."},
@@ -115,20 +164,20 @@ class RetrieveUpdateOrDeleteAccountView(APIView):
         except ValidationError as e:
             return Response(e.detail, status=e.status_code)
 
-    def get(self, _, account_id: int = ''):
-        instance = User.objects.get(id=account_id)
+    def get(self, request, account_id: int = ''):
+        instance = get_request_object(request, User, account_id)
 
         if instance.is_superuser:
-            serializer = UserSerializer(instance, fields=['id', 'username', 'email', 'is_superuser', 'password'])
+            serializer = UserRatingSerializer(instance, fields=['id', 'username', 'email', 'is_superuser', 'password', 'rating'])
 
         else:
-            serializer = UserSerializer(instance)
+            serializer = UserRatingSerializer(instance)
 
         return Response(serializer.data)
 
-    def delete(self, _, account_id: int = ''):
+    def delete(self, request, account_id: int = ''):
         try:
-            instance = User.objects.get(id=account_id)
+            instance = get_request_object(request, User, account_id)
 
             if self.request.user.id == instance.id:
                 instance.delete()